@@ -125,12 +125,16 @@ def create_history_gif(
 		images.append(task_frame)
 
 	# Process each history item
+	prev_screenshot: str | None = None
+	img_data = b''
 	for i, item in enumerate(history.history, 1):
 		if not item.state.screenshot:
 			continue
 
-		# Convert base64 screenshot to PIL Image
-		img_data = base64.b64decode(item.state.screenshot)
+		# Convert base64 screenshot to PIL Image (consecutive steps often share the same screenshot, only decode when it changes)
+		if item.state.screenshot != prev_screenshot:
+			img_data = base64.b64decode(item.state.screenshot)
+			prev_screenshot = item.state.screenshot
 		image = Image.open(io.BytesIO(img_data))
 
 		if show_goals and item.model_output:
@@ -176,33 +176,38 @@ class MessageManager:
 			result = []
 		step_number = step_info.step_number if step_info else None
 
-		self.state.read_state_description = ''
-
-		action_results = ''
+		# extracted_content can be an entire page of markdown: collect the fragments and join them once,
+		# and only format it into a log line when debug logging is on
+		read_state_parts: list[str] = []
+		action_result_lines: list[str] = []
 		result_len = len(result)
+		debug_enabled = logger.isEnabledFor(logging.DEBUG)
 		for idx, action_result in enumerate(result):
 			if action_result.include_extracted_content_only_once and action_result.extracted_content:
-				self.state.read_state_description += action_result.extracted_content + '\n'
-				logger.debug(f'Added extracted_content to read_state_description: {action_result.extracted_content}')
+				read_state_parts.append(action_result.extracted_content + '\n')
+				if debug_enabled:
+					logger.debug(f'Added extracted_content to read_state_description: {action_result.extracted_content}')
 
 			if action_result.long_term_memory:
-				action_results += f'Action {idx + 1}/{result_len}: {action_result.long_term_memory}\n'
-				logger.debug(f'Added long_term_memory to action_results: {action_result.long_term_memory}')
+				action_result_lines.append(f'Action {idx + 1}/{result_len}: {action_result.long_term_memory}\n')
+				if debug_enabled:
+					logger.debug(f'Added long_term_memory to action_results: {action_result.long_term_memory}')
 			elif action_result.extracted_content and not action_result.include_extracted_content_only_once:
-				action_results += f'Action {idx + 1}/{result_len}: {action_result.extracted_content}\n'
-				logger.debug(f'Added extracted_content to action_results: {action_result.extracted_content}')
+				action_result_lines.append(f'Action {idx + 1}/{result_len}: {action_result.extracted_content}\n')
+				if debug_enabled:
+					logger.debug(f'Added extracted_content to action_results: {action_result.extracted_content}')
 
 			if action_result.error:
 				if len(action_result.error) > 200:
 					error_text = action_result.error[:100] + '......' + action_result.error[-100:]
 				else:
 					error_text = action_result.error
-				action_results += f'Action {idx + 1}/{result_len}: {error_text}\n'
-				logger.debug(f'Added error to action_results: {error_text}')
+				action_result_lines.append(f'Action {idx + 1}/{result_len}: {error_text}\n')
+				if debug_enabled:
+					logger.debug(f'Added error to action_results: {error_text}')
 
-		if action_results:
-			action_results = f'Action Results:\n{action_results}'
-		action_results = action_results.strip('\n') if action_results else None
+		self.state.read_state_description = ''.join(read_state_parts)
+		action_results = ''.join(['Action Results:\n', *action_result_lines]).strip('\n') if action_result_lines else None
 
 		# Build the history item
 		if model_output is None:
@@ -335,8 +340,9 @@ class MessageManager:
 	def get_messages(self) -> list[BaseMessage]:
 		"""Get current message list, potentially trimmed to max tokens"""
 
-		# Log message history for debugging
-		logger.debug(self._log_history_lines())
+		# Log message history for debugging (building the history log walks every message, skip it unless it will be shown)
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug(self._log_history_lines())
 		self.last_input_messages = self.state.history.get_messages()
 		return self.last_input_messages
 
@@ -356,28 +362,36 @@ class MessageManager:
 		else:
 			raise ValueError(f'Invalid message type: {message_type}')
 
+	def _get_sensitive_values(self) -> dict[str, str]:
+		"""Flatten sensitive_data into {placeholder: value}, rebuilt on every call so in-place updates are never missed"""
+		assert self.sensitive_data, 'sensitive_data must be set to get sensitive values'
+
+		# Collect all sensitive values, immediately converting old format to new format
+		sensitive_values: dict[str, str] = {}
+
+		# Process all sensitive data entries
+		for key_or_domain, content in self.sensitive_data.items():
+			if isinstance(content, dict):
+				# Already in new format: {domain: {key: value}}
+				for key, val in content.items():
+					if val:  # Skip empty values
+						sensitive_values[key] = val
+			elif content:  # Old format: {key: value} - convert to new format internally
+				# We treat this as if it was {'http*://*': {key_or_domain: content}}
+				sensitive_values[key_or_domain] = content
+
+		return sensitive_values
+
 	@time_execution_sync('--filter_sensitive_data')
 	def _filter_sensitive_data(self, message: BaseMessage) -> BaseMessage:
 		"""Filter out sensitive data from the message"""
+		# flatten once per message rather than once per text part
+		sensitive_values = self._get_sensitive_values() if self.sensitive_data else {}
 
 		def replace_sensitive(value: str) -> str:
 			if not self.sensitive_data:
 				return value
 
-			# Collect all sensitive values, immediately converting old format to new format
-			sensitive_values: dict[str, str] = {}
-
-			# Process all sensitive data entries
-			for key_or_domain, content in self.sensitive_data.items():
-				if isinstance(content, dict):
-					# Already in new format: {domain: {key: value}}
-					for key, val in content.items():
-						if val:  # Skip empty values
-							sensitive_values[key] = val
-				elif content:  # Old format: {key: value} - convert to new format internally
-					# We treat this as if it was {'http*://*': {key_or_domain: content}}
-					sensitive_values[key_or_domain] = content
-
 			# If there are no valid sensitive data entries, just return the original value
 			if not sensitive_values:
 				logger.warning('No valid entries found in sensitive_data dictionary')
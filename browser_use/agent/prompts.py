@@ -1,5 +1,6 @@
 import importlib.resources
 from datetime import datetime
+from functools import cache
 from typing import TYPE_CHECKING, Optional
 
 from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, SystemMessage, UserMessage
@@ -12,6 +13,13 @@ if TYPE_CHECKING:
 	from browser_use.filesystem.file_system import FileSystem
 
 
+@cache
+def _read_prompt_template(template_filename: str) -> str:
+	"""Read a system prompt template once per process, a new SystemPrompt is built for every Agent"""
+	# This works both in development and when installed as a package
+	return importlib.resources.files('browser_use.agent').joinpath(template_filename).read_text(encoding='utf-8')
+
+
 class SystemPrompt:
 	def __init__(
 		self,
@@ -49,9 +57,7 @@ class SystemPrompt:
 			else:
 				template_filename = 'system_prompt_no_thinking.md'
 
-			# This works both in development and when installed as a package
-			with importlib.resources.files('browser_use.agent').joinpath(template_filename).open('r', encoding='utf-8') as f:
-				self.prompt_template = f.read()
+			self.prompt_template = _read_prompt_template(template_filename)
 		except Exception as e:
 			raise RuntimeError(f'Failed to load system prompt template: {e}')
 
@@ -136,21 +142,25 @@ class AgentMessagePrompt:
 
 	@observe_debug(name='_get_browser_state_description')
 	def _get_browser_state_description(self) -> str:
-		elements_text = self.browser_state.element_tree.clickable_elements_to_string(include_attributes=self.include_attributes)
+		# Bind the state objects once, they're read many times below
+		state = self.browser_state
+		pi = state.page_info
+		max_length = self.max_clickable_elements_length
+
+		elements_text = state.element_tree.clickable_elements_to_string(include_attributes=self.include_attributes)
 
-		if len(elements_text) > self.max_clickable_elements_length:
-			elements_text = elements_text[: self.max_clickable_elements_length]
-			truncated_text = f' (truncated to {self.max_clickable_elements_length} characters)'
+		if len(elements_text) > max_length:
+			elements_text = elements_text[:max_length]
+			truncated_text = f' (truncated to {max_length} characters)'
 		else:
 			truncated_text = ''
 
-		has_content_above = (self.browser_state.pixels_above or 0) > 0
-		has_content_below = (self.browser_state.pixels_below or 0) > 0
+		has_content_above = (state.pixels_above or 0) > 0
+		has_content_below = (state.pixels_below or 0) > 0
 
 		# Enhanced page information for the model
 		page_info_text = ''
-		if self.browser_state.page_info:
-			pi = self.browser_state.page_info
+		if pi:
 			# Compute page statistics dynamically
 			pages_above = pi.pixels_above / pi.viewport_height if pi.viewport_height > 0 else 0
 			pages_below = pi.pixels_below / pi.viewport_height if pi.viewport_height > 0 else 0
@@ -160,40 +170,34 @@ class AgentMessagePrompt:
 
 		if elements_text != '':
 			if has_content_above:
-				if self.browser_state.page_info:
-					pi = self.browser_state.page_info
-					pages_above = pi.pixels_above / pi.viewport_height if pi.viewport_height > 0 else 0
-					elements_text = f'... {self.browser_state.pixels_above} pixels above ({pages_above:.1f} pages) - scroll to see more or extract structured data if you are looking for specific information ...\n{elements_text}'
+				if pi:
+					elements_text = f'... {state.pixels_above} pixels above ({pages_above:.1f} pages) - scroll to see more or extract structured data if you are looking for specific information ...\n{elements_text}'
 				else:
-					elements_text = f'... {self.browser_state.pixels_above} pixels above - scroll to see more or extract structured data if you are looking for specific information ...\n{elements_text}'
+					elements_text = f'... {state.pixels_above} pixels above - scroll to see more or extract structured data if you are looking for specific information ...\n{elements_text}'
 			else:
 				elements_text = f'[Start of page]\n{elements_text}'
 			if has_content_below:
-				if self.browser_state.page_info:
-					pi = self.browser_state.page_info
-					pages_below = pi.pixels_below / pi.viewport_height if pi.viewport_height > 0 else 0
-					elements_text = f'{elements_text}\n... {self.browser_state.pixels_below} pixels below ({pages_below:.1f} pages) - scroll to see more or extract structured data if you are looking for specific information ...'
+				if pi:
+					elements_text = f'{elements_text}\n... {state.pixels_below} pixels below ({pages_below:.1f} pages) - scroll to see more or extract structured data if you are looking for specific information ...'
 				else:
-					elements_text = f'{elements_text}\n... {self.browser_state.pixels_below} pixels below - scroll to see more or extract structured data if you are looking for specific information ...'
+					elements_text = f'{elements_text}\n... {state.pixels_below} pixels below - scroll to see more or extract structured data if you are looking for specific information ...'
 			else:
 				elements_text = f'{elements_text}\n[End of page]'
 		else:
 			elements_text = 'empty page'
 
-		tabs_text = ''
 		current_tab_candidates = []
 
 		# Find tabs that match both URL and title to identify current tab more reliably
-		for tab in self.browser_state.tabs:
-			if tab.url == self.browser_state.url and tab.title == self.browser_state.title:
+		for tab in state.tabs:
+			if tab.url == state.url and tab.title == state.title:
 				current_tab_candidates.append(tab.page_id)
 
 		# If we have exactly one match, mark it as current
 		# Otherwise, don't mark any tab as current to avoid confusion
 		current_tab_id = current_tab_candidates[0] if len(current_tab_candidates) == 1 else None
 
-		for tab in self.browser_state.tabs:
-			tabs_text += f'Tab {tab.page_id}: {tab.url} - {tab.title[:30]}\n'
+		tabs_text = ''.join(f'Tab {tab.page_id}: {tab.url} - {tab.title[:30]}\n' for tab in state.tabs)
 
 		current_tab_text = f'Current tab: {current_tab_id}' if current_tab_id is not None else ''
 
@@ -248,21 +252,21 @@ Interactive elements from top layer of the current page inside the viewport{trun
 		):
 			use_vision = False
 
-		state_description = (
-			'<agent_history>\n'
-			+ (self.agent_history_description.strip('\n') if self.agent_history_description else '')
-			+ '\n</agent_history>\n'
-		)
-		state_description += '<agent_state>\n' + self._get_agent_state_description().strip('\n') + '\n</agent_state>\n'
-		state_description += '<browser_state>\n' + self._get_browser_state_description().strip('\n') + '\n</browser_state>\n'
-		state_description += (
-			'<read_state>\n'
-			+ (self.read_state_description.strip('\n') if self.read_state_description else '')
-			+ '\n</read_state>\n'
-		)
+		# collect the sections and join once, the browser state alone can be tens of KB so repeated += would copy it several times
+		state_parts = [
+			'<agent_history>\n',
+			self.agent_history_description.strip('\n') if self.agent_history_description else '',
+			'\n</agent_history>\n<agent_state>\n',
+			self._get_agent_state_description().strip('\n'),
+			'\n</agent_state>\n<browser_state>\n',
+			self._get_browser_state_description().strip('\n'),
+			'\n</browser_state>\n<read_state>\n',
+			self.read_state_description.strip('\n') if self.read_state_description else '',
+			'\n</read_state>\n',
+		]
 		if self.page_filtered_actions:
-			state_description += 'For this page, these additional actions are available:\n'
-			state_description += self.page_filtered_actions + '\n'
+			state_parts += ('For this page, these additional actions are available:\n', self.page_filtered_actions, '\n')
+		state_description = ''.join(state_parts)
 
 		if use_vision is True and self.screenshots:
 			# Start with text description
@@ -76,6 +76,8 @@ from browser_use.utils import (
 
 logger = logging.getLogger(__name__)
 
+THINK_TAGS_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+
 
 def log_response(response: AgentOutput, registry=None, logger=None) -> None:
 	"""Utility function to log the model's response."""
@@ -84,6 +86,10 @@ def log_response(response: AgentOutput, registry=None, logger=None) -> None:
 	if logger is None:
 		logger = logging.getLogger(__name__)
 
+	# Skip building the log lines entirely when INFO is filtered out
+	if not logger.isEnabledFor(logging.INFO):
+		return
+
 	# Only log thinking if it's present
 	if response.current_state.thinking:
 		logger.info(f'💡 Thinking:\n{response.current_state.thinking}')
@@ -461,6 +467,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		self._external_pause_event = asyncio.Event()
 		self._external_pause_event.set()
+		self._external_stop_event = asyncio.Event()
 
 	@property
 	def logger(self) -> logging.Logger:
@@ -974,13 +981,12 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		self.state.history.history.append(history_item)
 
 	def _remove_think_tags(self, text: str) -> str:
-		THINK_TAGS = re.compile(r'<think>.*?</think>', re.DOTALL)
-		STRAY_CLOSE_TAG = re.compile(r'.*?</think>', re.DOTALL)
 		# Step 1: Remove well-formed <think>...</think>
-		text = re.sub(THINK_TAGS, '', text)
+		text = THINK_TAGS_RE.sub('', text)
 		# Step 2: If there's an unmatched closing tag </think>,
 		#         remove everything up to and including that.
-		text = re.sub(STRAY_CLOSE_TAG, '', text)
+		#         (rpartition instead of a lazy .*?</think> regex, which rescans to the end from every position when there is no match)
+		text = text.rpartition('</think>')[2]
 		return text.strip()
 
 	@time_execution_async('--get_next_action')
@@ -1012,6 +1018,9 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 	def _log_step_context(self, current_page, browser_state_summary) -> None:
 		"""Log step context information"""
+		if not self.logger.isEnabledFor(logging.INFO):
+			return
+
 		url_short = current_page.url[:50] + '...' if len(current_page.url) > 50 else current_page.url
 		interactive_count = len(browser_state_summary.selector_map) if browser_state_summary else 0
 		self.logger.info(
@@ -1063,7 +1072,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 	def _log_step_completion_summary(self, step_start_time: float, result: list[ActionResult]) -> None:
 		"""Log step completion summary with action count, timing, and success/failure stats"""
-		if not result:
+		if not result or not self.logger.isEnabledFor(logging.INFO):
 			return
 
 		step_duration = time.time() - step_start_time
@@ -1086,20 +1095,18 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 		token_summary = self.token_cost_service.get_usage_tokens_for_model(self.llm.model)
 
-		# Prepare action_history data correctly
-		action_history_data = []
-		for item in self.state.history.history:
-			if item.model_output and item.model_output.action:
-				# Convert each ActionModel in the step to its dictionary representation
-				step_actions = [
-					action.model_dump(exclude_unset=True)
-					for action in item.model_output.action
-					if action  # Ensure action is not None if list allows it
-				]
-				action_history_data.append(step_actions)
-			else:
-				# Append None or [] if a step had no actions or no model output
-				action_history_data.append(None)
+		# Prepare action_history data correctly: each ActionModel in a step as its dictionary representation,
+		# or None if a step had no actions or no model output
+		action_history_data = [
+			[
+				action.model_dump(exclude_unset=True)
+				for action in model_output.action
+				if action  # Ensure action is not None if list allows it
+			]
+			if (model_output := item.model_output) and model_output.action
+			else None
+			for item in self.state.history.history
+		]
 
 		final_res = self.state.history.final_result()
 		final_result_str = json.dumps(final_res) if final_res is not None else None
@@ -1212,7 +1219,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				# Replace the polling with clean pause-wait
 				if self.state.paused:
 					self.logger.debug(f'⏸️ Step {step}: Agent paused, waiting to resume...')
-					await self.wait_until_resumed()
+					await self._wait_until_resumed_or_stopped()
 					signal_handler.reset()
 
 				# Check if we should stop due to too many failures
@@ -1227,11 +1234,12 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					agent_run_error = 'Agent stopped programmatically'
 					break
 
-				while self.state.paused:
-					await asyncio.sleep(0.2)  # Small delay to prevent CPU spinning
-					if self.state.stopped:  # Allow stopping while paused
-						agent_run_error = 'Agent stopped programmatically while paused'
-						break
+				while self.state.paused and not self.state.stopped:
+					await self._wait_until_resumed_or_stopped()
+				if self.state.stopped:  # Allow stopping while paused
+					self.logger.info('🛑 Agent stopped')
+					agent_run_error = 'Agent stopped programmatically while paused'
+					break
 
 				if on_step_start is not None:
 					await on_step_start(self)
@@ -1340,7 +1348,8 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 				if isinstance(self.settings.generate_gif, str):
 					output_path = self.settings.generate_gif
 
-				create_history_gif(task=self.task, history=self.state.history, output_path=output_path)
+				# rendering every screenshot into the gif is slow CPU + disk work, keep it off the event loop
+				await asyncio.to_thread(create_history_gif, task=self.task, history=self.state.history, output_path=output_path)
 
 				# Emit output file generated event for GIF
 				output_event = await CreateAgentOutputFileEvent.from_agent_and_file(self, output_path)
@@ -1384,20 +1393,24 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 			self.logger.debug('Timeout to remove highlights')
 
 		for i, action in enumerate(actions):
+			# Dump the action once, it's reused for the done check, the index lookups and the log line below
+			action_data = action.model_dump(exclude_unset=True)
+			action_index = action.get_index()
+
 			# DO NOT ALLOW TO CALL `done` AS A SINGLE ACTION
-			if i > 0 and action.model_dump(exclude_unset=True).get('done') is not None:
+			if i > 0 and action_data.get('done') is not None:
 				msg = f'Done action is allowed only as a single action - stopped after action {i} / {len(actions)}.'
 				logger.info(msg)
 				break
 
-			if action.get_index() is not None and i != 0:
+			if action_index is not None and i != 0:
 				new_browser_state_summary = await self.browser_session.get_state_summary(cache_clickable_elements_hashes=False)
 				new_selector_map = new_browser_state_summary.selector_map
 
 				# Detect index change after previous action
-				orig_target = cached_selector_map.get(action.get_index())  # type: ignore
+				orig_target = cached_selector_map.get(action_index)
 				orig_target_hash = orig_target.hash.branch_path_hash if orig_target else None
-				new_target = new_selector_map.get(action.get_index())  # type: ignore
+				new_target = new_selector_map.get(action_index)
 				new_target_hash = new_target.hash.branch_path_hash if new_target else None
 				if orig_target_hash != new_target_hash:
 					msg = f'Element index changed after action {i} / {len(actions)}, because page changed.'
@@ -1440,11 +1453,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 
 				results.append(result)
 
-				# Get action name from the action model
-				action_data = action.model_dump(exclude_unset=True)
-				action_name = next(iter(action_data.keys())) if action_data else 'unknown'
-				action_params = getattr(action, action_name, '')
-				self.logger.info(f'☑️ Executed action {i + 1}/{len(actions)}: {action_name}({action_params})')
+				# Get action name from the action model (only needed for the log line)
+				if self.logger.isEnabledFor(logging.INFO):
+					action_name = next(iter(action_data.keys())) if action_data else 'unknown'
+					action_params = getattr(action, action_name, '')
+					self.logger.info(f'☑️ Executed action {i + 1}/{len(actions)}: {action_name}({action_params})')
 				if results[-1].is_done or results[-1].error or i == len(actions) - 1:
 					break
 
@@ -1597,6 +1610,17 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 	async def wait_until_resumed(self):
 		await self._external_pause_event.wait()
 
+	async def _wait_until_resumed_or_stopped(self) -> None:
+		"""Block until resume() or stop() is called, woken by events instead of polling state.paused"""
+		resumed = asyncio.create_task(self._external_pause_event.wait())
+		stopped = asyncio.create_task(self._external_stop_event.wait())
+		try:
+			await asyncio.wait({resumed, stopped}, return_when=asyncio.FIRST_COMPLETED)
+		finally:
+			# also runs if run() is cancelled / times out while paused, so neither waiter is leaked
+			resumed.cancel()
+			stopped.cancel()
+
 	def pause(self) -> None:
 		"""Pause the agent before the next step"""
 		print(
@@ -1635,6 +1659,7 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		"""Stop the agent"""
 		self.logger.info('⏹️ Agent stopping')
 		self.state.stopped = True
+		self._external_stop_event.set()
 
 		# Task stopped
 
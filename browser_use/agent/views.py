@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 import json
 import traceback
 from dataclasses import dataclass
@@ -8,6 +9,7 @@ from typing import Any, Generic
 
 from openai import RateLimitError
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model, model_validator
+from pydantic_core import to_json
 from typing_extensions import TypeVar
 from uuid_extensions import uuid7str
 
@@ -331,12 +333,16 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 		return self.__str__()
 
 	def save_to_file(self, filepath: str | Path) -> None:
-		"""Save history to JSON file with proper serialization"""
+		"""Save history to JSON file with proper serialization (gzip-compressed if filepath ends in .gz)"""
 		try:
 			Path(filepath).parent.mkdir(parents=True, exist_ok=True)
 			data = self.model_dump()
-			with open(filepath, 'w', encoding='utf-8') as f:
-				json.dump(data, f, indent=2)
+			# pydantic-core's native serializer is several times faster than json.dump on large histories
+			payload = to_json(data, indent=2)
+			if Path(filepath).suffix == '.gz':
+				# level 1 is plenty for JSON text and keeps compression much faster than the disk write it saves
+				payload = gzip.compress(payload, compresslevel=1)
+			Path(filepath).write_bytes(payload)
 		except Exception as e:
 			raise e
 
@@ -380,9 +386,11 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 
 	@classmethod
 	def load_from_file(cls, filepath: str | Path, output_model: type[AgentOutput]) -> AgentHistoryList:
-		"""Load history from JSON file"""
-		with open(filepath, encoding='utf-8') as f:
-			data = json.load(f)
+		"""Load history from JSON file (gzip-compressed if filepath ends in .gz)"""
+		payload = Path(filepath).read_bytes()
+		if Path(filepath).suffix == '.gz':
+			payload = gzip.decompress(payload)
+		data = json.loads(payload)
 		# loop through history and validate output_model actions to enrich with custom actions
 		for h in data['history']:
 			if h['model_output']:
@@ -403,13 +411,8 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 
 	def errors(self) -> list[str | None]:
 		"""Get all errors from history, with None for steps without errors"""
-		errors = []
-		for h in self.history:
-			step_errors = [r.error for r in h.result if r.error]
-
-			# each step can have only one error
-			errors.append(step_errors[0] if step_errors else None)
-		return errors
+		# each step can have only one error
+		return [next((r.error for r in h.result if r.error), None) for h in self.history]
 
 	def final_result(self) -> None | str:
 		"""Final result from history"""
@@ -434,7 +437,8 @@ class AgentHistoryList(BaseModel, Generic[AgentStructuredOutput]):
 
 	def has_errors(self) -> bool:
 		"""Check if the agent has any non-None errors"""
-		return any(error is not None for error in self.errors())
+		# stop at the first error instead of building the full errors() list first
+		return any(r.error for h in self.history for r in h.result)
 
 	def urls(self) -> list[str | None]:
 		"""Get all unique URLs from history"""
@@ -9,11 +9,14 @@ import re
 import shutil
 import tempfile
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from functools import wraps
 from pathlib import Path
 from typing import Any, Self
 from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 
 import anyio
 from typing_extensions import deprecated
@@ -69,9 +72,24 @@ GLOBAL_PATCHRIGHT_API_OBJECT = None  # never instantiate the patchright API obje
 GLOBAL_PLAYWRIGHT_EVENT_LOOP = None  # track which event loop the global objects belong to
 GLOBAL_PATCHRIGHT_EVENT_LOOP = None  # track which event loop the global objects belong to
 
+# caps how many local chrome subprocesses are bootstrapped at once across all BrowserSessions (one semaphore per event loop)
+_BROWSER_LAUNCH_SEMAPHORES: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+
 MAX_SCREENSHOT_HEIGHT = 2000
 MAX_SCREENSHOT_WIDTH = 1920
 
+VALID_CSS_CLASS_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
+WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+
+def _get_browser_launch_semaphore() -> asyncio.Semaphore:
+	"""Get the semaphore limiting concurrent local browser launches on the running event loop."""
+	loop = asyncio.get_running_loop()
+	semaphore = _BROWSER_LAUNCH_SEMAPHORES.get(loop)
+	if semaphore is None:
+		semaphore = _BROWSER_LAUNCH_SEMAPHORES[loop] = asyncio.Semaphore(max(1, CONFIG.BROWSER_USE_MAX_CONCURRENT_LAUNCHES))
+	return semaphore
+
 
 def _log_glob_warning(domain: str, glob: str, logger: logging.Logger):
 	global _GLOB_WARNING_SHOWN
@@ -199,6 +217,44 @@ class CachedClickableElementHashes:
 	hashes: set[str]
 
 
+@dataclass
+class BrowserStartCircuitBreaker:
+	"""
+	Trips after repeated BrowserSession.start() failures so that callers (incl. the @require_healthy_browser auto-start)
+	fail fast for a cooldown window instead of re-attempting a slow launch/connect on every single call.
+	CLOSED -> (failure_threshold consecutive failures) -> OPEN -> (recovery_seconds elapsed) -> HALF_OPEN (one probe attempt allowed,
+	concurrent callers keep failing fast until it succeeds and closes the breaker, or fails and re-opens it)
+	"""
+
+	failure_threshold: int = 3
+	recovery_seconds: float = 30.0
+	consecutive_failures: int = 0
+	opened_at: float | None = None
+
+	def allow(self) -> bool:
+		if self.opened_at is None:
+			return True
+		if self.seconds_until_retry() > 0:
+			return False
+		# half-open: let this one probe through and restart the window so concurrent callers don't all pile in behind it
+		self.opened_at = time.monotonic()
+		return True
+
+	def seconds_until_retry(self) -> float:
+		if self.opened_at is None:
+			return 0.0
+		return max(0.0, self.recovery_seconds - (time.monotonic() - self.opened_at))
+
+	def record_success(self) -> None:
+		self.consecutive_failures = 0
+		self.opened_at = None
+
+	def record_failure(self) -> None:
+		self.consecutive_failures += 1
+		if self.consecutive_failures >= self.failure_threshold:
+			self.opened_at = time.monotonic()
+
+
 class BrowserSession(BaseModel):
 	"""
 	Represents an active browser session with a running browser process somewhere.
@@ -290,6 +346,7 @@ class BrowserSession(BaseModel):
 	_owns_browser_resources: bool = PrivateAttr(default=True)  # True if this instance owns and should clean up browser resources
 	_auto_download_pdfs: bool = PrivateAttr(default=True)  # Auto-download PDFs when detected
 	_subprocess: Any = PrivateAttr(default=None)  # Chrome subprocess reference for error handling
+	_start_circuit_breaker: BrowserStartCircuitBreaker = PrivateAttr(default_factory=BrowserStartCircuitBreaker)
 
 	@model_validator(mode='after')
 	def apply_session_overrides_to_profile(self) -> Self:
@@ -369,6 +426,12 @@ class BrowserSession(BaseModel):
 			self.logger.warning(f'💔 Browser {self._connection_str} has gone away, attempting to reconnect...')
 			self._reset_connection_state()
 
+		if not self._start_circuit_breaker.allow():
+			raise BrowserError(
+				f'⛔️ Not starting {self._connection_str}: the last {self._start_circuit_breaker.consecutive_failures} attempts failed, '
+				f'retrying in {self._start_circuit_breaker.seconds_until_retry():.0f}s at the earliest'
+			)
+
 		try:
 			# Setup
 			self.browser_profile.detect_display_configuration()
@@ -390,10 +453,13 @@ class BrowserSession(BaseModel):
 			await self._start_context_tracing()
 
 			self.initialized = True
+			self._start_circuit_breaker.record_success()
 			return self
 
-		except BaseException:
+		except BaseException as e:
 			self.initialized = False
+			if isinstance(e, Exception):  # don't count cancellation / KeyboardInterrupt as a broken browser
+				self._start_circuit_breaker.record_failure()
 			raise
 
 	@property
@@ -499,6 +565,9 @@ class BrowserSession(BaseModel):
 		if self.browser_profile.user_data_dir and Path(self.browser_profile.user_data_dir).name.startswith('browseruse-tmp'):
 			shutil.rmtree(self.browser_profile.user_data_dir, ignore_errors=True)
 
+		# Drop the chrome subprocess handle so its pipe transports and any buffered stdout/stderr are freed now instead of at GC time
+		self._subprocess = None
+
 		self._reset_connection_state()
 
 	async def close(self) -> None:
@@ -728,7 +797,8 @@ class BrowserSession(BaseModel):
 
 				# Try graceful termination first
 				proc.terminate()
-				self._kill_child_processes(_hint=_hint)
+				# _kill_child_processes() blocks on psutil's wait(timeout=5), run it off the event loop so other sessions/agents keep going
+				await asyncio.to_thread(self._kill_child_processes, _hint=_hint)
 				await asyncio.to_thread(proc.wait, timeout=4)
 			except psutil.NoSuchProcess:
 				# Process already gone, that's fine
@@ -1167,27 +1237,29 @@ class BrowserSession(BaseModel):
 						# Build final command
 						chrome_launch_cmd = [chromium_path] + final_args
 
-						# Launch chrome as subprocess
-						self.logger.info(
-							f' ↳ Spawning Chrome subprocess listening on CDP http://127.0.0.1:{debug_port}/ with user_data_dir= {_log_pretty_path(self.browser_profile.user_data_dir)}'
-						)
-						process = await asyncio.create_subprocess_exec(
-							*chrome_launch_cmd,
-							stdout=asyncio.subprocess.PIPE,
-							stderr=asyncio.subprocess.PIPE,
-						)
+						# Launch chrome as subprocess, only a few sessions at a time bootstrap a browser so
+						# starting many sessions at once doesn't thrash the CPU with simultaneous chrome startups
+						async with _get_browser_launch_semaphore():
+							self.logger.info(
+								f' ↳ Spawning Chrome subprocess listening on CDP http://127.0.0.1:{debug_port}/ with user_data_dir= {_log_pretty_path(self.browser_profile.user_data_dir)}'
+							)
+							process = await asyncio.create_subprocess_exec(
+								*chrome_launch_cmd,
+								stdout=asyncio.subprocess.PIPE,
+								stderr=asyncio.subprocess.PIPE,
+							)
 
-						# Store the subprocess reference for error handling
-						self._subprocess = process
+							# Store the subprocess reference for error handling
+							self._subprocess = process
 
-						# Store the browser PID
-						self.browser_pid = process.pid
-						self._set_browser_keep_alive(False)  # We launched it, so we should close it
-						# self.logger.debug(f'👶 Chrome subprocess launched with browser_pid={process.pid}')
+							# Store the browser PID
+							self.browser_pid = process.pid
+							self._set_browser_keep_alive(False)  # We launched it, so we should close it
+							# self.logger.debug(f'👶 Chrome subprocess launched with browser_pid={process.pid}')
 
-						# Use the existing setup_browser_via_browser_pid method to connect
-						# It will wait for the CDP port to become available
-						await self.setup_browser_via_browser_pid()
+							# Use the existing setup_browser_via_browser_pid method to connect
+							# It will wait for the CDP port to become available
+							await self.setup_browser_via_browser_pid()
 
 						# If connection failed, browser will be None
 						if not self.browser:
@@ -1770,64 +1842,43 @@ class BrowserSession(BaseModel):
 		if not already_disconnected:
 			self.logger.debug(f'⚰️ Browser {self._connection_str} disconnected')
 
-	def _check_for_singleton_lock_conflict(self) -> bool:
-		"""Check if the user data directory has a conflicting browser process.
+	def _find_process_using_user_data_dir(self) -> int | None:
+		"""Find another running browser process launched with our user_data_dir.
 
 		Returns:
-			True if there's a conflict (active process using this profile), False otherwise
+			The pid of the first matching process (excluding our own browser_pid), or None if there is none
 		"""
-		if not self.browser_profile.user_data_dir:
-			return False
+		assert self.browser_profile.user_data_dir, 'user_data_dir must be set to look for processes using it'
 
 		# Normalize the path for comparison
+		raw_dir = str(self.browser_profile.user_data_dir)
 		target_dir = str(Path(self.browser_profile.user_data_dir).expanduser().resolve())
 
-		# Check for running processes using this user data dir
 		for proc in psutil.process_iter(['pid', 'cmdline']):
 			# Skip our own browser process
-			if hasattr(self, 'browser_pid') and self.browser_pid and proc.info['pid'] == self.browser_pid:
+			if self.browser_pid and proc.info['pid'] == self.browser_pid:
 				continue
 
 			cmdline = proc.info['cmdline'] or []
 
 			# Check both formats: --user-data-dir=/path and --user-data-dir /path
 			for i, arg in enumerate(cmdline):
-				# Combined format: --user-data-dir=/path
 				if arg.startswith('--user-data-dir='):
-					try:
-						cmd_path = str(Path(arg.split('=', 1)[1]).expanduser().resolve())
-						if cmd_path == target_dir:
-							self.logger.debug(
-								f'🔍 Found conflicting Chrome process PID {proc.info["pid"]} using profile {_log_pretty_path(self.browser_profile.user_data_dir)}'
-							)
-							return True
-					except Exception:
-						# Fallback to string comparison if path resolution fails
-						if arg.split('=', 1)[1] == str(self.browser_profile.user_data_dir):
-							self.logger.debug(
-								f'🔍 Found conflicting Chrome process PID {proc.info["pid"]} using profile {_log_pretty_path(self.browser_profile.user_data_dir)}'
-							)
-							return True
-				# Separate format: --user-data-dir /path
+					cmd_dir = arg.split('=', 1)[1]
 				elif arg == '--user-data-dir' and i + 1 < len(cmdline):
-					try:
-						cmd_path = str(Path(cmdline[i + 1]).expanduser().resolve())
-						if cmd_path == target_dir:
-							self.logger.debug(
-								f'🔍 Found conflicting Chrome process PID {proc.info["pid"]} using profile {_log_pretty_path(self.browser_profile.user_data_dir)}'
-							)
-							return True
-					except Exception:
-						# Fallback to string comparison if path resolution fails
-						if cmdline[i + 1] == str(self.browser_profile.user_data_dir):
-							self.logger.debug(
-								f'🔍 Found conflicting Chrome process PID {proc.info["pid"]} using profile {_log_pretty_path(self.browser_profile.user_data_dir)}'
-							)
-							return True
+					cmd_dir = cmdline[i + 1]
+				else:
+					continue  # cheap prefix check first, only resolve paths for actual --user-data-dir args
 
-		# Note: We don't consider a SingletonLock file alone as a conflict
-		# because it might be stale. Only actual running processes count as conflicts.
-		return False
+				try:
+					is_match = str(Path(cmd_dir).expanduser().resolve()) == target_dir
+				except Exception:
+					# Fallback to string comparison if path resolution fails
+					is_match = cmd_dir == raw_dir
+				if is_match:
+					return proc.info['pid']
+
+		return None
 
 	def _fallback_to_temp_profile(self, reason: str = 'SingletonLock conflict') -> None:
 		"""Fallback to a temporary profile directory when the current one is locked.
@@ -1859,56 +1910,31 @@ class BrowserSession(BaseModel):
 					f'Unusable path provided for user_data_dir= {_log_pretty_path(self.browser_profile.user_data_dir)} (check for typos/permissions issues)'
 				) from e
 
-			# Remove stale singleton lock file ONLY if no process is using this profile
-			# This must happen BEFORE checking for conflicts to avoid false positives
+			# Scan the process table once, the result is used both to clean up a stale lock and to detect conflicts
 			singleton_lock = self.browser_profile.user_data_dir / 'SingletonLock'
-			if singleton_lock.exists():
-				# Check if any process is actually using this user_data_dir
-				has_active_process = False
-				target_dir = str(self.browser_profile.user_data_dir)
-				for proc in psutil.process_iter(['pid', 'cmdline']):
-					# Skip our own browser process
-					if hasattr(self, 'browser_pid') and self.browser_pid and proc.info['pid'] == self.browser_pid:
-						continue
+			lock_exists = singleton_lock.exists()
+			conflicting_pid = self._find_process_using_user_data_dir() if (lock_exists or check_conflicts) else None
 
-					cmdline = proc.info['cmdline'] or []
-					# Check both formats: --user-data-dir=/path and --user-data-dir /path
-					for i, arg in enumerate(cmdline):
-						if arg.startswith('--user-data-dir='):
-							try:
-								if str(Path(arg.split('=', 1)[1]).expanduser().resolve()) == target_dir:
-									has_active_process = True
-									break
-							except Exception:
-								if arg.split('=', 1)[1] == str(self.browser_profile.user_data_dir):
-									has_active_process = True
-									break
-						elif arg == '--user-data-dir' and i + 1 < len(cmdline):
-							try:
-								if str(Path(cmdline[i + 1]).expanduser().resolve()) == target_dir:
-									has_active_process = True
-									break
-							except Exception:
-								if cmdline[i + 1] == str(self.browser_profile.user_data_dir):
-									has_active_process = True
-									break
-					if has_active_process:
-						break
-
-				if not has_active_process:
-					# No active process, safe to remove stale lock
-					try:
-						# Handle both regular files and symlinks
-						if singleton_lock.is_symlink() or singleton_lock.exists():
-							singleton_lock.unlink()
-							self.logger.debug(
-								f'🧹 Removed stale SingletonLock file from {_log_pretty_path(self.browser_profile.user_data_dir)} (no active Chrome process found)'
-							)
-					except Exception:
-						pass  # Ignore errors removing lock file
+			# Remove stale singleton lock file ONLY if no process is using this profile
+			# This must happen BEFORE checking for conflicts to avoid false positives
+			if lock_exists and conflicting_pid is None:
+				# No active process, safe to remove stale lock
+				try:
+					# Handle both regular files and symlinks
+					singleton_lock.unlink()
+					self.logger.debug(
+						f'🧹 Removed stale SingletonLock file from {_log_pretty_path(self.browser_profile.user_data_dir)} (no active Chrome process found)'
+					)
+				except Exception:
+					pass  # Ignore errors removing lock file
 
 			# Check for conflicts and fallback if needed (AFTER cleaning stale locks)
-			if check_conflicts and self._check_for_singleton_lock_conflict():
+			# Note: We don't consider a SingletonLock file alone as a conflict
+			# because it might be stale. Only actual running processes count as conflicts.
+			if check_conflicts and conflicting_pid is not None:
+				self.logger.debug(
+					f'🔍 Found conflicting Chrome process PID {conflicting_pid} using profile {_log_pretty_path(self.browser_profile.user_data_dir)}'
+				)
 				self._fallback_to_temp_profile()
 				# Recursive call without conflict checking to prepare the new temp dir
 				return self.prepare_user_data_dir(check_conflicts=False)
@@ -2169,12 +2195,23 @@ class BrowserSession(BaseModel):
 	async def get_tabs_info(self) -> list[TabInfo]:
 		"""Get information about all tabs"""
 		assert self.browser_context is not None, 'BrowserContext is not set up'
+		pages = list(self.browser_context.pages)
+
+		# fetch all titles concurrently so one slow tab doesn't add its timeout to every other tab's
+		titles = await asyncio.gather(
+			*(asyncio.wait_for(page.title(), timeout=3.0) for page in pages),
+			return_exceptions=True,
+		)
+		# only real errors mean an unresponsive tab, let cancellation / KeyboardInterrupt propagate instead of closing tabs
+		for title in titles:
+			if isinstance(title, BaseException) and not isinstance(title, Exception):
+				raise title
+
 		tabs_info = []
-		for page_id, page in enumerate(self.browser_context.pages):
-			try:
-				title = await asyncio.wait_for(page.title(), timeout=3.0)
+		for page_id, (page, title) in enumerate(zip(pages, titles)):
+			if not isinstance(title, BaseException):
 				tab_info = TabInfo(page_id=page_id, url=page.url, title=title)
-			except Exception:
+			else:
 				# page.title() can hang forever on tabs that are crashed/disappeared/about:blank
 				# but we should preserve the real URL and not mislead the LLM about tab availability
 				self.logger.debug(
@@ -2203,6 +2240,22 @@ class BrowserSession(BaseModel):
 
 		return tabs_info
 
+	def _get_page_id(self, page: Page) -> int | None:
+		"""Get the index of a page in browser_context.pages, i.e. the page_id get_tabs_info() will report for it."""
+		try:
+			return self.tabs.index(page)
+		except ValueError:
+			return None
+
+	def _get_title_from_tabs_info(self, page: Page, page_id: int | None, tabs_info: list[TabInfo]) -> str | None:
+		"""Reuse the title get_tabs_info() fetched for a page, None if it has none (page closed or unresponsive)."""
+		# new tab pages get a placeholder title in tabs_info when they fail to respond, so never reuse theirs
+		if page_id is None or is_new_tab_page(page.url):
+			return None
+		# page_id was taken before get_tabs_info() ran, if tabs opened/closed in between the ids shifted,
+		# so only trust an entry that still points at this page's url (else the caller fetches the title itself)
+		return next((tab.title for tab in tabs_info if tab.page_id == page_id and tab.url == page.url), None)
+
 	@retry(timeout=20, retries=1, semaphore_limit=1, semaphore_scope='self')
 	async def _set_viewport_size(self, page: Page, viewport: dict[str, int] | ViewportSize) -> None:
 		"""Set viewport size with timeout protection."""
@@ -2391,57 +2444,61 @@ class BrowserSession(BaseModel):
 			return
 
 		try:
-			cookies_file_path = Path(path or self.browser_profile.cookies_file).expanduser().resolve()
-			cookies_file_path.parent.mkdir(parents=True, exist_ok=True)
+			# use anyio.Path so the file I/O doesn't block the event loop
+			cookies_file_path = await anyio.Path(path or self.browser_profile.cookies_file).expanduser()
+			cookies_file_path = await cookies_file_path.resolve()
+			await cookies_file_path.parent.mkdir(parents=True, exist_ok=True)
 
 			# Write to a temporary file first
 			cookies = cookies or []
 			temp_path = cookies_file_path.with_suffix('.tmp')
-			temp_path.write_text(json.dumps(cookies, indent=4))
+			await temp_path.write_text(json.dumps(cookies, indent=4))
 
 			try:
 				# backup any existing cookies_file if one is already present
-				cookies_file_path.replace(cookies_file_path.with_suffix('.json.bak'))
+				await cookies_file_path.replace(cookies_file_path.with_suffix('.json.bak'))
 			except Exception:
 				pass
-			temp_path.replace(cookies_file_path)
+			await temp_path.replace(cookies_file_path)
 
-			self.logger.info(f'🍪 Saved {len(cookies)} cookies to cookies_file= {_log_pretty_path(cookies_file_path)}')
+			self.logger.info(f'🍪 Saved {len(cookies)} cookies to cookies_file= {_log_pretty_path(Path(cookies_file_path))}')
 		except Exception as e:
 			self.logger.warning(
-				f'❌ Failed to save cookies to cookies_file= {_log_pretty_path(cookies_file_path)}: {type(e).__name__}: {e}'
+				f'❌ Failed to save cookies to cookies_file= {_log_pretty_path(Path(cookies_file_path))}: {type(e).__name__}: {e}'
 			)
 
 	async def _save_storage_state_to_file(self, path: str | Path, storage_state: dict[str, Any] | None) -> None:
 		try:
-			json_path = Path(path).expanduser().resolve()
-			json_path.parent.mkdir(parents=True, exist_ok=True)
+			# use anyio.Path so the file I/O doesn't block the event loop
+			json_path = await anyio.Path(path).expanduser()
+			json_path = await json_path.resolve()
+			await json_path.parent.mkdir(parents=True, exist_ok=True)
 			assert self.browser_context is not None, 'BrowserContext is not set up'
 			storage_state = storage_state or dict(await self.browser_context.storage_state())
 
 			# always atomic merge storage states, never overwrite (so two browsers can share the same storage_state.json)
 			merged_storage_state = storage_state
-			if json_path.exists():
+			if await json_path.exists():
 				try:
-					existing_storage_state = json.loads(json_path.read_text())
+					existing_storage_state = json.loads(await json_path.read_text())
 					merged_storage_state = merge_dicts(existing_storage_state, storage_state)
 				except Exception as e:
 					self.logger.error(
-						f'❌ Failed to merge cookie changes with existing storage_state= {_log_pretty_path(json_path)}: {type(e).__name__}: {e}'
+						f'❌ Failed to merge cookie changes with existing storage_state= {_log_pretty_path(Path(json_path))}: {type(e).__name__}: {e}'
 					)
 					return
 
 			# write to .tmp file first to avoid partial writes, then mv original to .bak and .tmp to original
 			temp_path = json_path.with_suffix('.json.tmp')
-			temp_path.write_text(json.dumps(merged_storage_state, indent=4))
+			await temp_path.write_text(json.dumps(merged_storage_state, indent=4))
 			try:
-				json_path.replace(json_path.with_suffix('.json.bak'))
+				await json_path.replace(json_path.with_suffix('.json.bak'))
 			except Exception:
 				pass
-			temp_path.replace(json_path)
+			await temp_path.replace(json_path)
 
 			self.logger.info(
-				f'🍪 Saved {len(storage_state["cookies"]) + len(storage_state.get("origins", []))} cookies to storage_state= {_log_pretty_path(json_path)}'
+				f'🍪 Saved {len(storage_state["cookies"]) + len(storage_state.get("origins", []))} cookies to storage_state= {_log_pretty_path(Path(json_path))}'
 			)
 		except Exception as e:
 			self.logger.warning(f'❌ Failed to save cookies to storage_state= {_log_pretty_path(path)}: {type(e).__name__}: {e}')
@@ -2620,6 +2677,7 @@ class BrowserSession(BaseModel):
 	async def _wait_for_stable_network(self):
 		pending_requests = set()
 		last_activity = asyncio.get_event_loop().time()
+		network_changed = asyncio.Event()  # set whenever pending_requests changes, so the wait loop below doesn't have to poll
 
 		page = await self.get_current_page()
 
@@ -2717,12 +2775,14 @@ class BrowserSession(BaseModel):
 			nonlocal last_activity
 			pending_requests.add(request)
 			last_activity = asyncio.get_event_loop().time()
+			network_changed.set()
 			# self.logger.debug(f'Request started: {request.url} ({request.resource_type})')
 
 		async def on_response(response):
 			request = response.request
 			if request not in pending_requests:
 				return
+			network_changed.set()
 
 			# Filter by content type if available
 			content_type = response.headers.get('content-type', '').lower()
@@ -2766,22 +2826,29 @@ class BrowserSession(BaseModel):
 
 		now = asyncio.get_event_loop().time()
 		try:
-			# Wait for idle time
+			# Wait for idle time, sleeping until the network changes or the idle window / overall timeout expires
 			start_time = asyncio.get_event_loop().time()
+			deadline = start_time + self.browser_profile.maximum_wait_page_load_time
 			while True:
-				await asyncio.sleep(0.1)
 				now = asyncio.get_event_loop().time()
-				if (
-					len(pending_requests) == 0
-					and (now - last_activity) >= self.browser_profile.wait_for_network_idle_page_load_time
-				):
-					break
-				if now - start_time > self.browser_profile.maximum_wait_page_load_time:
+				if now >= deadline:
 					self.logger.debug(
 						f'{self} Network timeout after {self.browser_profile.maximum_wait_page_load_time}s with {len(pending_requests)} '
 						f'pending requests: {[r.url for r in pending_requests]}'
 					)
 					break
+				wait_time = deadline - now
+				if len(pending_requests) == 0:
+					idle_remaining = self.browser_profile.wait_for_network_idle_page_load_time - (now - last_activity)
+					if idle_remaining <= 0:
+						break
+					wait_time = min(wait_time, idle_remaining)
+
+				network_changed.clear()
+				try:
+					await asyncio.wait_for(network_changed.wait(), timeout=wait_time)
+				except TimeoutError:
+					pass
 
 		finally:
 			# Clean up event listeners
@@ -2800,7 +2867,7 @@ class BrowserSession(BaseModel):
 		Also checks if the loaded URL is allowed.
 		"""
 		# Start timing
-		start_time = time.time()
+		start_time = time.monotonic()
 
 		# Wait for page load
 		page = await self.get_current_page()
@@ -2817,7 +2884,7 @@ class BrowserSession(BaseModel):
 			)
 
 		# Calculate remaining time to meet minimum WAIT_TIME
-		elapsed = time.time() - start_time
+		elapsed = time.monotonic() - start_time
 		remaining = max((timeout_overwrite or self.browser_profile.minimum_wait_page_load_time) - elapsed, 0)
 
 		# Skip expensive performance API logging - can cause significant delays on complex pages
@@ -3104,20 +3171,23 @@ class BrowserSession(BaseModel):
 		# Get basic info - no DOM parsing to avoid errors
 		url = getattr(page, 'url', 'unknown')
 
-		# Try to get title safely
-		try:
-			# timeout after 2 seconds
-			title = await asyncio.wait_for(page.title(), timeout=2.0)
-		except Exception:
-			title = 'Page Load Error'
-
 		# Try to get tabs info safely
+		current_page_id = self._get_page_id(page)  # before get_tabs_info(), which may close unresponsive tabs
 		try:
 			# timeout after 2 seconds
 			tabs_info = await retry(timeout=2, retries=0)(self.get_tabs_info)()
 		except Exception:
 			tabs_info = []
 
+		# Try to get title safely, reusing the one get_tabs_info() already fetched if possible
+		title = self._get_title_from_tabs_info(page, current_page_id, tabs_info)
+		if title is None:
+			try:
+				# timeout after 2 seconds
+				title = await asyncio.wait_for(page.title(), timeout=2.0)
+			except Exception:
+				title = 'Page Load Error'
+
 		# Create minimal DOM element for error state
 		minimal_element_tree = DOMElementNode(
 			tag_name='body',
@@ -3202,6 +3272,7 @@ class BrowserSession(BaseModel):
 				content = DOMState(element_tree=minimal_element_tree, selector_map={})
 
 			self.logger.debug('📋 Getting tabs info...')
+			current_page_id = self._get_page_id(page)  # before get_tabs_info(), which may close unresponsive tabs
 			tabs_info = await self.get_tabs_info()
 			self.logger.debug('✅ Tabs info completed')
 
@@ -3235,20 +3306,18 @@ class BrowserSession(BaseModel):
 				self.logger.warning(f'❌ Screenshot failed for {_log_pretty_url(page.url)}: {type(e).__name__} {e}')
 				screenshot_b64 = None
 
-			# Get comprehensive page information
+			# Get comprehensive page information (includes the scroll info, no need for a separate get_scroll_info() round-trip).
+			# pixels_below is measured against max(documentElement, body) scrollHeight, so pages that scroll on <body> report it too
 			page_info = await self.get_page_info(page)
-			try:
-				self.logger.debug('📏 Getting scroll info...')
-				pixels_above, pixels_below = await asyncio.wait_for(self.get_scroll_info(page), timeout=5.0)
-				self.logger.debug('✅ Scroll info completed')
-			except Exception as e:
-				self.logger.warning(f'Failed to get scroll info: {type(e).__name__}')
-				pixels_above, pixels_below = 0, 0
+			pixels_above, pixels_below = page_info.pixels_above, page_info.pixels_below
 
-			try:
-				title = await asyncio.wait_for(page.title(), timeout=3.0)
-			except Exception:
-				title = 'Title unavailable'
+			# get_tabs_info() already fetched the current page's title, only ask the page again if it couldn't
+			title = self._get_title_from_tabs_info(page, current_page_id, tabs_info)
+			if title is None:
+				try:
+					title = await asyncio.wait_for(page.title(), timeout=3.0)
+				except Exception:
+					title = 'Title unavailable'
 
 			# Check if this is a minimal fallback state
 			browser_errors = []
@@ -3473,14 +3542,22 @@ class BrowserSession(BaseModel):
 				'Browser is unable to load any new about:blank pages (something is very wrong or browser is extremely overloaded)'
 			)
 
+	@asynccontextmanager
+	async def _recovery_scope(self) -> AsyncIterator[None]:
+		"""Mark the session as in recovery for the duration of the block, always clearing the flag on exit."""
+		self._in_recovery = True
+		try:
+			yield
+		finally:
+			self._in_recovery = False
+
 	async def _recover_unresponsive_page(self, calling_method: str, timeout_ms: int | None = None) -> None:
 		"""Recover from an unresponsive page by closing and reopening it."""
 		self.logger.warning(f'⚠️ Page JS engine became unresponsive in {calling_method}(), attempting recovery...')
 		timeout_ms = min(3000, int(timeout_ms or self.browser_profile.default_navigation_timeout or 5000))
 
 		# Prevent re-entrance
-		self._in_recovery = True
-		try:
+		async with self._recovery_scope():
 			# Get current URL before recovery
 			assert self.agent_current_page, 'Agent current page is not set'
 			current_url = self.agent_current_page.url
@@ -3525,10 +3602,6 @@ class BrowserSession(BaseModel):
 			)
 			await self._create_blank_fallback_page(current_url)
 
-		finally:
-			# Always clear recovery flag
-			self._in_recovery = False
-
 	# region - Browser Actions
 	@observe_debug(name='take_screenshot', ignore_output=True)
 	@retry(
@@ -3620,11 +3693,15 @@ class BrowserSession(BaseModel):
 	async def _get_unique_filename(directory: str | Path, filename: str) -> str:
 		"""Generate a unique filename for downloads by appending (1), (2), etc., if a file already exists."""
 		base, ext = os.path.splitext(filename)
-		counter = 1
+		counter = 0
 		new_filename = filename
-		while os.path.exists(os.path.join(directory, new_filename)):
-			new_filename = f'{base} ({counter}){ext}'
+		existing_filenames: set[str] = set()
+		# a free name costs one stat(); on a collision list the directory once so taken candidates are skipped in memory
+		while new_filename in existing_filenames or os.path.exists(os.path.join(directory, new_filename)):
+			if not existing_filenames:
+				existing_filenames = set(os.listdir(directory))
 			counter += 1
+			new_filename = f'{base} ({counter}){ext}'
 		return new_filename
 
 	async def _start_context_tracing(self):
@@ -3716,9 +3793,6 @@ class BrowserSession(BaseModel):
 
 			# Handle class attributes
 			if 'class' in element.attributes and element.attributes['class'] and include_dynamic_attributes:
-				# Define a regex pattern for valid class names in CSS
-				valid_class_name_pattern = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
-
 				# Iterate through the class attribute values
 				classes = element.attributes['class'].split()
 				for class_name in classes:
@@ -3727,7 +3801,7 @@ class BrowserSession(BaseModel):
 						continue
 
 					# Check if the class name is valid
-					if valid_class_name_pattern.match(class_name):
+					if VALID_CSS_CLASS_NAME_RE.match(class_name):
 						# Append the valid class name to the CSS selector
 						css_selector += f'.{class_name}'
 					else:
@@ -3794,7 +3868,7 @@ class BrowserSession(BaseModel):
 					if '\n' in value:
 						value = value.split('\n')[0]
 					# Regex-substitute *any* whitespace with a single space, then strip.
-					collapsed_value = re.sub(r'\s+', ' ', value).strip()
+					collapsed_value = WHITESPACE_RUN_RE.sub(' ', value).strip()
 					# Escape embedded double-quotes.
 					safe_value = collapsed_value.replace('"', '\\"')
 					css_selector += f'[{safe_attribute}*="{safe_value}"]'
@@ -4204,13 +4278,17 @@ class BrowserSession(BaseModel):
 
 	@require_healthy_browser(usable_page=True, reopen_page=True)
 	async def get_scroll_info(self, page: Page) -> tuple[int, int]:
-		"""Get scroll position information for the current page."""
-		scroll_y = await page.evaluate('window.scrollY')
-		viewport_height = await page.evaluate('window.innerHeight')
-		total_height = await page.evaluate('document.documentElement.scrollHeight')
+		"""Get scroll position information for the current page (same pixels_above/pixels_below as get_page_info())."""
+		# Read all three values in one JavaScript call instead of three separate CDP round-trips
+		scroll_data = await page.evaluate("""() => ({
+			scroll_y: window.scrollY,
+			viewport_height: window.innerHeight,
+			total_height: Math.max(document.documentElement.scrollHeight, document.body.scrollHeight || 0),
+		})""")
+		scroll_y = scroll_data['scroll_y']
 		# Convert to int to handle fractional pixels
 		pixels_above = int(scroll_y)
-		pixels_below = int(max(0, total_height - (scroll_y + viewport_height)))
+		pixels_below = int(max(0, scroll_data['total_height'] - (scroll_y + scroll_data['viewport_height'])))
 		return pixels_above, pixels_below
 
 	@require_healthy_browser(usable_page=True, reopen_page=True)
@@ -1022,7 +1022,7 @@ class BrowserUseApp(App):
 
 			# Panel updates are already happening via the timer in update_info_panels
 
-			task_start_time = time.time()
+			task_start_time = time.monotonic()
 			error_msg = None
 
 			try:
@@ -1051,7 +1051,7 @@ class BrowserUseApp(App):
 				# No need to call update_info_panels() here as it's already updating via timer
 
 				# Capture telemetry for task completion
-				duration = time.time() - task_start_time
+				duration = time.monotonic() - task_start_time
 				self._telemetry.capture(
 					CLITelemetryEvent(
 						version=get_browser_use_version(),
@@ -1217,8 +1217,9 @@ async def run_prompt_mode(prompt: str, ctx: click.Context, debug: bool = False):
 
 	# Initialize telemetry
 	telemetry = ProductTelemetry()
-	start_time = time.time()
+	start_time = time.monotonic()
 	error_msg = None
+	llm = None  # bound up front so the error telemetry below works even if get_llm() fails
 
 	try:
 		# Load config
@@ -1275,7 +1276,7 @@ async def run_prompt_mode(prompt: str, ctx: click.Context, debug: bool = False):
 				mode='oneshot',
 				model=llm.model if hasattr(llm, 'model') else None,
 				model_provider=llm.__class__.__name__ if llm else None,
-				duration_seconds=time.time() - start_time,
+				duration_seconds=time.monotonic() - start_time,
 			)
 		)
 
@@ -1287,9 +1288,9 @@ async def run_prompt_mode(prompt: str, ctx: click.Context, debug: bool = False):
 				version=get_browser_use_version(),
 				action='error',
 				mode='oneshot',
-				model=llm.model if hasattr(llm, 'model') else None,
-				model_provider=llm.__class__.__name__ if llm and 'llm' in locals() else None,
-				duration_seconds=time.time() - start_time,
+				model=getattr(llm, 'model', None),
+				model_provider=llm.__class__.__name__ if llm else None,
+				duration_seconds=time.monotonic() - start_time,
 				error_message=error_msg,
 			)
 		)
@@ -165,6 +165,14 @@ class OldConfig:
 	def WIN_FONT_DIR(self) -> str:
 		return os.getenv('WIN_FONT_DIR', 'C:\\Windows\\Fonts')
 
+	@property
+	def BROWSER_USE_MAX_CONCURRENT_LAUNCHES(self) -> int:
+		return int(os.getenv('BROWSER_USE_MAX_CONCURRENT_LAUNCHES', str(min(4, os.cpu_count() or 1))))
+
+	@property
+	def BROWSER_USE_MCP_MAX_CONCURRENT_AGENTS(self) -> int:
+		return int(os.getenv('BROWSER_USE_MCP_MAX_CONCURRENT_AGENTS', '2'))
+
 
 class FlatEnvConfig(BaseSettings):
 	"""All environment variables in a flat namespace."""
@@ -198,6 +206,8 @@ class FlatEnvConfig(BaseSettings):
 	IN_DOCKER: bool | None = Field(default=None)
 	IS_IN_EVALS: bool = Field(default=False)
 	WIN_FONT_DIR: str = Field(default='C:\\Windows\\Fonts')
+	BROWSER_USE_MAX_CONCURRENT_LAUNCHES: int | None = Field(default=None)
+	BROWSER_USE_MCP_MAX_CONCURRENT_AGENTS: int | None = Field(default=None)
 
 	# MCP-specific env vars
 	BROWSER_USE_CONFIG_PATH: str | None = Field(default=None)
@@ -381,9 +391,9 @@ class Config:
 		config_path = self._get_config_path()
 		return load_and_migrate_config(config_path)
 
-	def _get_default_profile(self) -> dict[str, Any]:
+	def _get_default_profile(self, db_config: DBStyleConfigJSON | None = None) -> dict[str, Any]:
 		"""Get the default browser profile configuration."""
-		db_config = self._get_db_config()
+		db_config = db_config or self._get_db_config()
 		for profile in db_config.browser_profile.values():
 			if profile.default:
 				return profile.model_dump(exclude_none=True)
@@ -394,9 +404,9 @@ class Config:
 
 		return {}
 
-	def _get_default_llm(self) -> dict[str, Any]:
+	def _get_default_llm(self, db_config: DBStyleConfigJSON | None = None) -> dict[str, Any]:
 		"""Get the default LLM configuration."""
-		db_config = self._get_db_config()
+		db_config = db_config or self._get_db_config()
 		for llm in db_config.llm.values():
 			if llm.default:
 				return llm.model_dump(exclude_none=True)
@@ -407,9 +417,9 @@ class Config:
 
 		return {}
 
-	def _get_default_agent(self) -> dict[str, Any]:
+	def _get_default_agent(self, db_config: DBStyleConfigJSON | None = None) -> dict[str, Any]:
 		"""Get the default agent configuration."""
-		db_config = self._get_db_config()
+		db_config = db_config or self._get_db_config()
 		for agent in db_config.agent.values():
 			if agent.default:
 				return agent.model_dump(exclude_none=True)
@@ -422,10 +432,12 @@ class Config:
 
 	def _load_config(self) -> dict[str, Any]:
 		"""Load configuration with env var overrides for MCP components."""
+		# Read and parse config.json once for all three sections
+		db_config = self._get_db_config()
 		config = {
-			'browser_profile': self._get_default_profile(),
-			'llm': self._get_default_llm(),
-			'agent': self._get_default_agent(),
+			'browser_profile': self._get_default_profile(db_config),
+			'llm': self._get_default_llm(db_config),
+			'agent': self._get_default_agent(db_config),
 		}
 
 		# Fresh env config for overrides
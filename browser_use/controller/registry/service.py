@@ -28,6 +28,8 @@ Context = TypeVar('Context')
 
 logger = logging.getLogger(__name__)
 
+SECRET_PLACEHOLDER_RE = re.compile(r'<secret>(.*?)</secret>')
+
 
 class Registry(Generic[Context]):
 	"""Service for registering and managing actions"""
@@ -394,7 +396,7 @@ class Registry(Generic[Context]):
 
 	def _log_sensitive_data_usage(self, placeholders_used: set[str], current_url: str | None) -> None:
 		"""Log when sensitive data is being used on a page"""
-		if placeholders_used:
+		if placeholders_used and logger.isEnabledFor(logging.INFO):
 			url_info = f' on {current_url}' if current_url and not is_new_tab_page(current_url) else ''
 			logger.info(f'🔒 Using sensitive data placeholders: {", ".join(sorted(placeholders_used))}{url_info}')
 
@@ -413,8 +415,6 @@ class Registry(Generic[Context]):
 		Returns:
 			BaseModel: The parameter object with placeholders replaced by actual values
 		"""
-		secret_pattern = re.compile(r'<secret>(.*?)</secret>')
-
 		# Set to track all missing placeholders across the full object
 		all_missing_placeholders = set()
 		# Set to track successfully replaced placeholders
@@ -440,7 +440,7 @@ class Registry(Generic[Context]):
 
 		def recursively_replace_secrets(value: str | dict | list) -> str | dict | list:
 			if isinstance(value, str):
-				matches = secret_pattern.findall(value)
+				matches = SECRET_PLACEHOLDER_RE.findall(value)
 
 				for placeholder in matches:
 					if placeholder in applicable_secrets:
@@ -359,7 +359,7 @@ Only use this for specific queries for information retrieval from the page. Don'
 				except Exception:
 					pass
 
-				if iframe.url != page.url and not iframe.url.startswith('data:') and not iframe.url.startswith('about:'):
+				if iframe.url != page.url and not iframe.url.startswith(('data:', 'about:')):
 					content += f'\n\nIFRAME {iframe.url}:\n'
 					# Run markdownify in a thread pool for iframe content as well
 					try:
@@ -1019,11 +1019,15 @@ Explain the content of the page and that the requested information is not availa
 			await select_cell_or_range(cell_or_range=cell_or_range, page=page)
 
 			# simulate paste event from clipboard with TSV content
-			await page.evaluate(f"""
-				const clipboardData = new DataTransfer();
-				clipboardData.setData('text/plain', `{new_contents_tsv}`);
-				document.activeElement.dispatchEvent(new ClipboardEvent('paste', {{clipboardData}}));
-			""")
+			# (passed as an argument rather than interpolated, so backticks or ${...} in the content can't break out of the script)
+			await page.evaluate(
+				"""(text) => {
+					const clipboardData = new DataTransfer();
+					clipboardData.setData('text/plain', text);
+					document.activeElement.dispatchEvent(new ClipboardEvent('paste', {clipboardData}));
+				}""",
+				new_contents_tsv,
+			)
 
 			return ActionResult(
 				extracted_content=f'Updated cells: {cell_or_range} = {new_contents_tsv}',
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from pydantic import BaseModel
 
 
-@dataclass
+@dataclass(slots=True)
 class HashedDomElement:
 	"""
 	Hash of the dom element to be used as a unique identifier
@@ -37,7 +37,7 @@ class ViewportInfo(BaseModel):
 	height: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DOMHistoryElement:
 	tag_name: str
 	xpath: str
@@ -1,4 +1,5 @@
 import logging
+from functools import cache
 from importlib import resources
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
@@ -23,6 +24,12 @@ from browser_use.utils import is_new_tab_page, time_execution_async
 # 	height: int
 
 
+@cache
+def _load_dom_tree_js() -> str:
+	"""Read the buildDomTree JS source once per process, a new DomService is created for every browser state request"""
+	return resources.files('browser_use.dom.dom_tree').joinpath('index.js').read_text()
+
+
 class DomService:
 	logger: logging.Logger
 
@@ -31,7 +38,7 @@ class DomService:
 		self.xpath_cache = {}
 		self.logger = logger or logging.getLogger(__name__)
 
-		self.js_code = resources.files('browser_use.dom.dom_tree').joinpath('index.js').read_text()
+		self.js_code = _load_dom_tree_js()
 
 	# region - Clickable elements
 	@time_execution_async('--get_clickable_elements')
@@ -2,11 +2,9 @@ import asyncio
 import re
 import shutil
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from markdown_pdf import MarkdownPdf, Section
 from pydantic import BaseModel, Field
 
 INVALID_FILENAME_ERROR_MESSAGE = 'Error: Invalid filename format. Must be alphanumeric with supported extension.'
@@ -51,8 +49,7 @@ class BaseFile(BaseModel, ABC):
 
 	async def sync_to_disk(self, path: Path) -> None:
 		file_path = path / self.full_name
-		with ThreadPoolExecutor() as executor:
-			await asyncio.get_event_loop().run_in_executor(executor, lambda: file_path.write_text(self.content))
+		await asyncio.to_thread(file_path.write_text, self.content)
 
 	async def write(self, content: str, path: Path) -> None:
 		self.write_file_content(content)
@@ -118,6 +115,9 @@ class PdfFile(BaseFile):
 		return 'pdf'
 
 	def sync_to_disk_sync(self, path: Path) -> None:
+		# imported lazily: markdown_pdf pulls in PyMuPDF, which is slow to import and only needed for .pdf files
+		from markdown_pdf import MarkdownPdf, Section
+
 		file_path = path / self.full_name
 		try:
 			md_pdf = MarkdownPdf()
@@ -127,8 +127,7 @@ class PdfFile(BaseFile):
 			raise FileSystemError(f"Error: Could not write to file '{self.full_name}'. {str(e)}")
 
 	async def sync_to_disk(self, path: Path) -> None:
-		with ThreadPoolExecutor() as executor:
-			await asyncio.get_event_loop().run_in_executor(executor, lambda: self.sync_to_disk_sync(path))
+		await asyncio.to_thread(self.sync_to_disk_sync, path)
 
 
 class FileSystemState(BaseModel):
@@ -161,6 +160,8 @@ class FileSystem:
 			'csv': CsvFile,
 			'pdf': PdfFile,
 		}
+		# Compile the filename pattern once: name.extension, with the extension being one of _file_types
+		self._filename_pattern = re.compile(rf'^[a-zA-Z0-9_\-]+\.({"|".join(self._file_types.keys())})$')
 
 		self.files = {}
 		if create_default_files:
@@ -191,10 +192,7 @@ class FileSystem:
 
 	def _is_valid_filename(self, file_name: str) -> bool:
 		"""Check if filename matches the required pattern: name.extension"""
-		# Build extensions pattern from _file_types
-		extensions = '|'.join(self._file_types.keys())
-		pattern = rf'^[a-zA-Z0-9_\-]+\.({extensions})$'
-		return bool(re.match(pattern, file_name))
+		return self._filename_pattern.match(file_name) is not None
 
 	def _parse_filename(self, filename: str) -> tuple[str, str]:
 		"""Parse filename into name and extension. Always check _is_valid_filename first."""
@@ -356,7 +354,7 @@ class FileSystem:
 	def describe(self) -> str:
 		"""List all files with their content information using file-specific display methods"""
 		DISPLAY_CHARS = 400
-		description = ''
+		description_parts: list[str] = []
 
 		for file_obj in self.files.values():
 			# Skip todo.md from description
@@ -367,7 +365,7 @@ class FileSystem:
 
 			# Handle empty files
 			if not content:
-				description += f'<file>\n{file_obj.full_name} - [empty file]\n</file>\n'
+				description_parts.append(f'<file>\n{file_obj.full_name} - [empty file]\n</file>\n')
 				continue
 
 			lines = content.splitlines()
@@ -378,53 +376,55 @@ class FileSystem:
 				f'<file>\n{file_obj.full_name} - {line_count} lines\n<content>\n{content}\n</content>\n</file>\n'
 			)
 			if len(content) < int(1.5 * DISPLAY_CHARS):
-				description += whole_file_description
+				description_parts.append(whole_file_description)
 				continue
 
 			# For larger files, display start and end previews
 			half_display_chars = DISPLAY_CHARS // 2
 
 			# Get start preview
-			start_preview = ''
-			start_line_count = 0
+			start_lines: list[str] = []
 			chars_count = 0
 			for line in lines:
 				if chars_count + len(line) + 1 > half_display_chars:
 					break
-				start_preview += line + '\n'
+				start_lines.append(line)
 				chars_count += len(line) + 1
-				start_line_count += 1
+			start_line_count = len(start_lines)
 
-			# Get end preview
-			end_preview = ''
-			end_line_count = 0
+			# Get end preview (collected back to front, reversed once when joining)
+			end_lines: list[str] = []
 			chars_count = 0
 			for line in reversed(lines):
 				if chars_count + len(line) + 1 > half_display_chars:
 					break
-				end_preview = line + '\n' + end_preview
+				end_lines.append(line)
 				chars_count += len(line) + 1
-				end_line_count += 1
+			end_line_count = len(end_lines)
 
 			# Calculate lines in between
 			middle_line_count = line_count - start_line_count - end_line_count
 			if middle_line_count <= 0:
-				description += whole_file_description
+				description_parts.append(whole_file_description)
 				continue
 
-			start_preview = start_preview.strip('\n').rstrip()
-			end_preview = end_preview.strip('\n').rstrip()
+			start_preview = '\n'.join(start_lines).strip('\n').rstrip()
+			end_preview = '\n'.join(reversed(end_lines)).strip('\n').rstrip()
 
 			# Format output
 			if not (start_preview or end_preview):
-				description += f'<file>\n{file_obj.full_name} - {line_count} lines\n<content>\n{middle_line_count} lines...\n</content>\n</file>\n'
+				description_parts.append(
+					f'<file>\n{file_obj.full_name} - {line_count} lines\n<content>\n{middle_line_count} lines...\n</content>\n</file>\n'
+				)
 			else:
-				description += f'<file>\n{file_obj.full_name} - {line_count} lines\n<content>\n{start_preview}\n'
-				description += f'... {middle_line_count} more lines ...\n'
-				description += f'{end_preview}\n'
-				description += '</content>\n</file>\n'
-
-		return description.strip('\n')
+				description_parts.append(
+					f'<file>\n{file_obj.full_name} - {line_count} lines\n<content>\n{start_preview}\n'
+					f'... {middle_line_count} more lines ...\n'
+					f'{end_preview}\n'
+					'</content>\n</file>\n'
+				)
+
+		return ''.join(description_parts).strip('\n')
 
 	def get_todo_contents(self) -> str:
 		"""Get todo file contents"""
@@ -26,8 +26,8 @@ class AWSBedrockMessageSerializer:
 	@staticmethod
 	def _is_url_image(url: str) -> bool:
 		"""Check if the URL is a regular HTTP/HTTPS image URL."""
-		return url.startswith(('http://', 'https://')) and any(
-			url.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp']
+		return url.startswith(('http://', 'https://')) and url.lower().endswith(
+			('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp')
 		)
 
 	@staticmethod
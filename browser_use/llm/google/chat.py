@@ -1,4 +1,7 @@
+import asyncio
 import json
+import random
+import re
 from dataclasses import dataclass
 from typing import Any, Literal, TypeVar, overload
 
@@ -23,21 +26,42 @@ VerifiedGeminiModels = Literal[
 ]
 
 
-def _is_retryable_error(exception):
-	"""Check if an error should be retried based on error message patterns."""
-	error_msg = str(exception).lower()
-
-	# Rate limit patterns
-	rate_limit_patterns = ['rate limit', 'resource exhausted', 'quota exceeded', 'too many requests', '429']
+# Error message substrings (matched against the lowercased message) that mark an error as retryable
+RETRYABLE_ERROR_RE = re.compile(
+	'|'.join(
+		map(
+			re.escape,
+			[
+				# Rate limit patterns
+				'rate limit',
+				'resource exhausted',
+				'quota exceeded',
+				'too many requests',
+				'429',
+				# Server error patterns
+				'service unavailable',
+				'internal server error',
+				'bad gateway',
+				'503',
+				'502',
+				'500',
+				# Connection error patterns
+				'connection',
+				'timeout',
+				'network',
+				'unreachable',
+			],
+		)
+	)
+)
 
-	# Server error patterns
-	server_error_patterns = ['service unavailable', 'internal server error', 'bad gateway', '503', '502', '500']
 
-	# Connection error patterns
-	connection_patterns = ['connection', 'timeout', 'network', 'unreachable']
+def _is_retryable_error(exception):
+	"""Check if an error should be retried based on error message patterns."""
+	if isinstance(exception, (TimeoutError, ConnectionError)):
+		return True
 
-	all_patterns = rate_limit_patterns + server_error_patterns + connection_patterns
-	return any(pattern in error_msg for pattern in all_patterns)
+	return RETRYABLE_ERROR_RE.search(str(exception).lower()) is not None
 
 
 @dataclass
@@ -269,10 +293,8 @@ class ChatGoogle(BaseChatModel):
 					if not _is_retryable_error(e) or attempt == 9:  # Last attempt
 						break
 
-					# Simple exponential backoff
-					import asyncio
-
-					delay = min(60.0, 1.0 * (2.0**attempt))  # Cap at 60s
+					# Exponential backoff with full jitter, so concurrent agents hitting the same rate limit don't retry in lockstep
+					delay = random.uniform(0, min(60.0, 1.0 * (2.0**attempt)))  # Cap at 60s
 					await asyncio.sleep(delay)
 
 			# Re-raise the last exception if all retries failed
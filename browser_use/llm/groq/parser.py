@@ -10,6 +10,12 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
 
+# Everything before the first { (e.g. <|header_start|>assistant<|header_end|> or <function=AgentOutput>)
+LEADING_NON_JSON_RE = re.compile(r'^.*?(?=\{)', re.DOTALL)
+# A } followed by an HTML-like tag and anything after it, e.g. </function> or <|header_start|>
+# (<|...|> special tokens are covered too, since they are also <...> tags)
+TRAILING_TAGS_RE = re.compile(r'\}(\s*<[^>]*>.*?$)', re.DOTALL)
+
 
 class ParseFailedGenerationError(Exception):
 	pass
@@ -35,12 +41,11 @@ def try_parse_groq_failed_generation(
 		# This handles cases like <|header_start|>assistant<|header_end|> and <function=AgentOutput>
 		# Only remove content before { if content doesn't already start with {
 		if not content.strip().startswith('{'):
-			content = re.sub(r'^.*?(?=\{)', '', content, flags=re.DOTALL)
+			content = LEADING_NON_JSON_RE.sub('', content)
 
 		# Remove common HTML-like tags and patterns at the end, but be more conservative
 		# Look for patterns like </function>, <|header_start|>, etc. after the JSON
-		content = re.sub(r'\}(\s*<[^>]*>.*?$)', '}', content, flags=re.DOTALL)
-		content = re.sub(r'\}(\s*<\|[^|]*\|>.*?$)', '}', content, flags=re.DOTALL)
+		content = TRAILING_TAGS_RE.sub('}', content)
 
 		# Handle extra characters after the JSON, including stray braces
 		# Find the position of the last } that would close the main JSON object
@@ -83,7 +83,7 @@ class MCPClient:
 			logger.debug(f'Already connected to {self.server_name}')
 			return
 
-		start_time = time.time()
+		start_time = time.monotonic()
 		error_msg = None
 
 		try:
@@ -113,7 +113,7 @@ class MCPClient:
 			raise
 		finally:
 			# Capture telemetry for connect action
-			duration = time.time() - start_time
+			duration = time.monotonic() - start_time
 			self._telemetry.capture(
 				MCPClientTelemetryEvent(
 					server_name=self.server_name,
@@ -163,7 +163,7 @@ class MCPClient:
 		if not self._connected:
 			return
 
-		start_time = time.time()
+		start_time = time.monotonic()
 		error_msg = None
 
 		try:
@@ -193,7 +193,7 @@ class MCPClient:
 			logger.error(f'Error disconnecting from MCP server: {e}')
 		finally:
 			# Capture telemetry for disconnect action
-			duration = time.time() - start_time
+			duration = time.monotonic() - start_time
 			self._telemetry.capture(
 				MCPClientTelemetryEvent(
 					server_name=self.server_name,
@@ -308,7 +308,7 @@ class MCPClient:
 
 				logger.debug(f"🔧 Calling MCP tool '{tool.name}' with params: {tool_params}")
 
-				start_time = time.time()
+				start_time = time.monotonic()
 				error_msg = None
 
 				try:
@@ -329,7 +329,7 @@ class MCPClient:
 					return ActionResult(error=error_msg, success=False)
 				finally:
 					# Capture telemetry for tool call
-					duration = time.time() - start_time
+					duration = time.monotonic() - start_time
 					self._telemetry.capture(
 						MCPClientTelemetryEvent(
 							server_name=self.server_name,
@@ -351,7 +351,7 @@ class MCPClient:
 
 				logger.debug(f"🔧 Calling MCP tool '{tool.name}' with no params")
 
-				start_time = time.time()
+				start_time = time.monotonic()
 				error_msg = None
 
 				try:
@@ -372,7 +372,7 @@ class MCPClient:
 					return ActionResult(error=error_msg, success=False)
 				finally:
 					# Capture telemetry for tool call
-					duration = time.time() - start_time
+					duration = time.monotonic() - start_time
 					self._telemetry.capture(
 						MCPClientTelemetryEvent(
 							server_name=self.server_name,
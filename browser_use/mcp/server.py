@@ -29,6 +29,7 @@ import logging
 import os
 import sys
 import time
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any, Literal
 
@@ -71,7 +72,7 @@ for name in list(logging.root.manager.loggerDict.keys()):
 # Import browser_use modules
 from browser_use import ActionModel, Agent
 from browser_use.browser import BrowserProfile, BrowserSession
-from browser_use.config import get_default_llm, get_default_profile, load_browser_use_config
+from browser_use.config import CONFIG, get_default_llm, get_default_profile, load_browser_use_config
 from browser_use.controller.service import Controller
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.llm.openai.chat import ChatOpenAI
@@ -131,6 +132,10 @@ except ImportError:
 from browser_use.telemetry import MCPServerTelemetryEvent, ProductTelemetry
 from browser_use.utils import get_browser_use_version
 
+# Bulkhead for retry_with_browser_use_agent: every agent task launches its own browser, so bound how many run at once
+# (limit comes from CONFIG.BROWSER_USE_MCP_MAX_CONCURRENT_AGENTS)
+AGENT_TASK_QUEUE_TIMEOUT = 30.0  # seconds an extra agent task may wait for a free slot before failing fast
+
 
 def get_parent_process_cmdline() -> str | None:
 	"""Get the command line of all parent processes up the chain."""
@@ -178,7 +183,24 @@ class BrowserUseServer:
 		self.llm: ChatOpenAI | None = None
 		self.file_system: FileSystem | None = None
 		self._telemetry = ProductTelemetry()
-		self._start_time = time.time()
+		self._start_time = time.monotonic()
+		self._max_agent_tasks = max(1, CONFIG.BROWSER_USE_MCP_MAX_CONCURRENT_AGENTS)
+		self._agent_task_slots = asyncio.Semaphore(self._max_agent_tasks)
+
+		# Direct browser control tools, dispatched by name in _execute_tool()
+		self._browser_tools: dict[str, Callable[[dict[str, Any]], Awaitable[str]]] = {
+			'browser_navigate': lambda args: self._navigate(args['url'], args.get('new_tab', False)),
+			'browser_click': lambda args: self._click(args['index'], args.get('new_tab', False)),
+			'browser_type': lambda args: self._type_text(args['index'], args['text']),
+			'browser_get_state': lambda args: self._get_browser_state(args.get('include_screenshot', False)),
+			'browser_extract_content': lambda args: self._extract_content(args['query'], args.get('extract_links', False)),
+			'browser_scroll': lambda args: self._scroll(args.get('direction', 'down')),
+			'browser_go_back': lambda args: self._go_back(),
+			'browser_close': lambda args: self._close_browser(),
+			'browser_list_tabs': lambda args: self._list_tabs(),
+			'browser_switch_tab': lambda args: self._switch_tab(args['tab_index']),
+			'browser_close_tab': lambda args: self._close_tab(args['tab_index']),
+		}
 
 		# Setup handlers
 		self._setup_handlers()
@@ -358,7 +380,7 @@ class BrowserUseServer:
 		@self.server.call_tool()
 		async def handle_call_tool(name: str, arguments: dict[str, Any] | None) -> list[types.TextContent]:
 			"""Handle tool execution."""
-			start_time = time.time()
+			start_time = time.monotonic()
 			error_msg = None
 			try:
 				result = await self._execute_tool(name, arguments or {})
@@ -369,7 +391,7 @@ class BrowserUseServer:
 				return [types.TextContent(type='text', text=f'Error: {str(e)}')]
 			finally:
 				# Capture telemetry for tool calls
-				duration = time.time() - start_time
+				duration = time.monotonic() - start_time
 				self._telemetry.capture(
 					MCPServerTelemetryEvent(
 						version=get_browser_use_version(),
@@ -399,38 +421,9 @@ class BrowserUseServer:
 			if not self.browser_session:
 				await self._init_browser_session()
 
-			if tool_name == 'browser_navigate':
-				return await self._navigate(arguments['url'], arguments.get('new_tab', False))
-
-			elif tool_name == 'browser_click':
-				return await self._click(arguments['index'], arguments.get('new_tab', False))
-
-			elif tool_name == 'browser_type':
-				return await self._type_text(arguments['index'], arguments['text'])
-
-			elif tool_name == 'browser_get_state':
-				return await self._get_browser_state(arguments.get('include_screenshot', False))
-
-			elif tool_name == 'browser_extract_content':
-				return await self._extract_content(arguments['query'], arguments.get('extract_links', False))
-
-			elif tool_name == 'browser_scroll':
-				return await self._scroll(arguments.get('direction', 'down'))
-
-			elif tool_name == 'browser_go_back':
-				return await self._go_back()
-
-			elif tool_name == 'browser_close':
-				return await self._close_browser()
-
-			elif tool_name == 'browser_list_tabs':
-				return await self._list_tabs()
-
-			elif tool_name == 'browser_switch_tab':
-				return await self._switch_tab(arguments['tab_index'])
-
-			elif tool_name == 'browser_close_tab':
-				return await self._close_tab(arguments['tab_index'])
+			handler = self._browser_tools.get(tool_name)
+			if handler is not None:
+				return await handler(arguments)
 
 		return f'Unknown tool: {tool_name}'
 
@@ -503,6 +496,24 @@ class BrowserUseServer:
 		use_vision: bool = True,
 	) -> str:
 		"""Run an autonomous agent task."""
+		try:
+			await asyncio.wait_for(self._agent_task_slots.acquire(), timeout=AGENT_TASK_QUEUE_TIMEOUT)
+		except TimeoutError:
+			return f'Error: {self._max_agent_tasks} agent tasks are already running, try again once one has finished'
+
+		try:
+			return await self._run_browser_use_agent(task, max_steps, model, allowed_domains, use_vision)
+		finally:
+			self._agent_task_slots.release()
+
+	async def _run_browser_use_agent(
+		self,
+		task: str,
+		max_steps: int,
+		model: str,
+		allowed_domains: list[str] | None,
+		use_vision: bool,
+	) -> str:
 		logger.debug(f'Running agent task: {task}')
 
 		# Get LLM config
@@ -815,7 +826,7 @@ async def main():
 		await server.run()
 	finally:
 		# Capture telemetry for server stop
-		duration = time.time() - server._start_time
+		duration = time.monotonic() - server._start_time
 		server._telemetry.capture(
 			MCPServerTelemetryEvent(
 				version=get_browser_use_version(),
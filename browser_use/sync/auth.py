@@ -164,11 +164,11 @@ class DeviceAuthClient:
 		Poll for the access token.
 		Returns token info when authorized, None if timeout.
 		"""
-		start_time = time.time()
+		start_time = time.monotonic()
 
 		if self.http_client:
 			# Use injected client for all requests
-			while time.time() - start_time < timeout:
+			while time.monotonic() - start_time < timeout:
 				try:
 					response = await self.http_client.post(
 						f'{self.base_url.rstrip("/")}/api/v1/oauth/device/token',
@@ -220,7 +220,7 @@ class DeviceAuthClient:
 		else:
 			# Create a new client for polling
 			async with httpx.AsyncClient() as client:
-				while time.time() - start_time < timeout:
+				while time.monotonic() - start_time < timeout:
 					try:
 						response = await client.post(
 							f'{self.base_url.rstrip("/")}/api/v1/oauth/device/token',
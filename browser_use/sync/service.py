@@ -5,7 +5,9 @@ Cloud sync service for sending events to the Browser Use cloud.
 import asyncio
 import json
 import logging
+import os
 import shutil
+from pathlib import Path
 
 import anyio
 import httpx
@@ -17,6 +19,32 @@ from browser_use.sync.auth import TEMP_USER_ID, DeviceAuthClient
 logger = logging.getLogger(__name__)
 
 
+def _rewrite_wal_user_ids(wal_path: Path, user_id: str, device_id: str) -> None:
+	"""Set user_id/device_id on every event in the WAL, streaming line by line into a temp file that replaces it."""
+	tmp_wal_path = wal_path.with_suffix('.jsonl.tmp')
+	try:
+		with open(wal_path, 'rb') as src, open(tmp_wal_path, 'wb') as dst:
+			for line in src:
+				if not line.strip():
+					continue
+				if not line.endswith(b'\n'):
+					# half-written by a concurrent append, pass it through untouched
+					dst.write(line)
+					continue
+				event = json.loads(line)
+				# Update user_id and add device_id to all events
+				if 'user_id' in event:
+					event['user_id'] = user_id
+				event['device_id'] = device_id
+				dst.write(json.dumps(event).encode() + b'\n')
+			# the agent's event bus keeps appending to the WAL while we rewrite it,
+			# carry over anything written past our last read so it isn't lost with the old inode
+			dst.write(src.read())
+		os.replace(tmp_wal_path, wal_path)
+	finally:
+		tmp_wal_path.unlink(missing_ok=True)
+
+
 class CloudSync:
 	"""Service for syncing events to the Browser Use cloud"""
 
@@ -162,25 +190,11 @@ class CloudSync:
 					f'CloudSync failed to update saved event user_ids after auth: Agent EventBus WAL file not found: {wal_path}'
 				)
 
-			# Read all events
-			events = []
-			content = await anyio.Path(wal_path).read_text()
-			for line in content.splitlines():
-				if line.strip():
-					events.append(json.loads(line))
-
-			# Update user_id and device_id
 			user_id = self.auth_client.user_id
 			device_id = self.auth_client.device_id
-			for event in events:
-				if 'user_id' in event:
-					event['user_id'] = user_id
-				# Add device_id to all events
-				event['device_id'] = device_id
 
-			# Write back
-			updated_content = '\n'.join(json.dumps(event) for event in events) + '\n'
-			await anyio.Path(wal_path).write_text(updated_content)
+			# Rewrite in a single worker thread, the WAL can be large (events carry screenshots etc.)
+			await anyio.to_thread.run_sync(_rewrite_wal_user_ids, wal_path, user_id, device_id)
 
 		except Exception as e:
 			logger.warning(f'Failed to update WAL user IDs: {e}')
@@ -347,14 +347,20 @@ class TokenCost:
 
 	def get_usage_tokens_for_model(self, model: str) -> ModelUsageTokens:
 		"""Get usage tokens for a specific model"""
-		filtered_usage = [u for u in self.usage_history if u.model == model]
+		# Accumulate all counters in a single pass over the history
+		prompt_tokens = prompt_cached_tokens = completion_tokens = 0
+		for u in self.usage_history:
+			if u.model == model:
+				prompt_tokens += u.usage.prompt_tokens
+				prompt_cached_tokens += u.usage.prompt_cached_tokens or 0
+				completion_tokens += u.usage.completion_tokens
 
 		return ModelUsageTokens(
 			model=model,
-			prompt_tokens=sum(u.usage.prompt_tokens for u in filtered_usage),
-			prompt_cached_tokens=sum(u.usage.prompt_cached_tokens or 0 for u in filtered_usage),
-			completion_tokens=sum(u.usage.completion_tokens for u in filtered_usage),
-			total_tokens=sum(u.usage.prompt_tokens + u.usage.completion_tokens for u in filtered_usage),
+			prompt_tokens=prompt_tokens,
+			prompt_cached_tokens=prompt_cached_tokens,
+			completion_tokens=completion_tokens,
+			total_tokens=prompt_tokens + completion_tokens,
 		)
 
 	async def get_usage_summary(self, model: str | None = None, since: datetime | None = None) -> UsageSummary:
@@ -380,20 +386,20 @@ class TokenCost:
 				entry_count=0,
 			)
 
-		# Calculate totals
-		total_prompt = sum(u.usage.prompt_tokens for u in filtered_usage)
-		total_completion = sum(u.usage.completion_tokens for u in filtered_usage)
-		total_tokens = total_prompt + total_completion
-		total_prompt_cached = sum(u.usage.prompt_cached_tokens or 0 for u in filtered_usage)
-		models = list({u.model for u in filtered_usage})
-
-		# Calculate per-model stats with record-by-record cost calculation
+		# Calculate totals and per-model stats in a single pass, with record-by-record cost calculation
+		total_prompt = 0
+		total_completion = 0
+		total_prompt_cached = 0
 		model_stats: dict[str, ModelUsageStats] = {}
 		total_prompt_cost = 0.0
 		total_completion_cost = 0.0
 		total_prompt_cached_cost = 0.0
 
 		for entry in filtered_usage:
+			total_prompt += entry.usage.prompt_tokens
+			total_completion += entry.usage.completion_tokens
+			total_prompt_cached += entry.usage.prompt_cached_tokens or 0
+
 			if entry.model not in model_stats:
 				model_stats[entry.model] = ModelUsageStats(model=entry.model)
 
@@ -423,7 +429,7 @@ class TokenCost:
 			total_prompt_cached_cost=total_prompt_cached_cost,
 			total_completion_tokens=total_completion,
 			total_completion_cost=total_completion_cost,
-			total_tokens=total_tokens,
+			total_tokens=total_prompt + total_completion,
 			total_cost=total_prompt_cost + total_completion_cost + total_prompt_cached_cost,
 			entry_count=len(filtered_usage),
 			by_model=model_stats,
@@ -326,9 +326,9 @@ def time_execution_sync(additional_text: str = '') -> Callable[[Callable[P, R]],
 	def decorator(func: Callable[P, R]) -> Callable[P, R]:
 		@wraps(func)
 		def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-			start_time = time.time()
+			start_time = time.monotonic()
 			result = func(*args, **kwargs)
-			execution_time = time.time() - start_time
+			execution_time = time.monotonic() - start_time
 			# Only log if execution takes more than 0.25 seconds
 			if execution_time > 0.25:
 				self_has_logger = args and getattr(args[0], 'logger', None)
@@ -354,9 +354,9 @@ def time_execution_async(
 	def decorator(func: Callable[P, Coroutine[Any, Any, R]]) -> Callable[P, Coroutine[Any, Any, R]]:
 		@wraps(func)
 		async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-			start_time = time.time()
+			start_time = time.monotonic()
 			result = await func(*args, **kwargs)
-			execution_time = time.time() - start_time
+			execution_time = time.monotonic() - start_time
 			# Only log if execution takes more than 0.25 seconds to avoid spamming the logs
 			# you can lower this threshold locally when you're doing dev work to performance optimize stuff
 			if execution_time > 0.25:
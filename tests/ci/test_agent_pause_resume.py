@@ -0,0 +1,30 @@
+"""
+Test that a paused agent can be stopped without having to resume it first.
+"""
+
+import asyncio
+
+from browser_use import Agent, BrowserProfile, BrowserSession
+from tests.ci.conftest import create_mock_llm
+
+
+class TestAgentPauseResume:
+	"""Test pause/stop control flow in Agent.run()"""
+
+	async def test_stop_while_paused_ends_run(self):
+		"""Test that stop() during a pause ends run() promptly instead of waiting for a resume that never comes"""
+		agent = Agent(
+			task='Test task',
+			llm=create_mock_llm(),
+			browser_session=BrowserSession(browser_profile=BrowserProfile(headless=True, user_data_dir=None)),
+		)
+		agent.pause()
+
+		run_task = asyncio.create_task(agent.run(max_steps=3))
+		await asyncio.sleep(0.1)
+		assert not run_task.done()  # still waiting for resume() or stop()
+
+		agent.stop()
+		history = await asyncio.wait_for(run_task, timeout=5)
+		assert len(history.history) == 0  # no step ran
+		assert agent.state.n_steps == 1
@@ -254,6 +254,12 @@ def test_filter_sensitive_data(message_manager):
 	assert '<secret>password</secret>' in result.content
 	assert '<secret>email</secret>' in result.content
 
+	# Case 6: In-place updates to the shared sensitive_data dict are picked up
+	message_manager.sensitive_data['example.com']['otp'] = '918273'
+	message = UserMessage(content='My one-time code is 918273')
+	result = message_manager._filter_sensitive_data(message)
+	assert result.content == 'My one-time code is <secret>otp</secret>'
+
 
 def test_is_new_tab_page():
 	"""Test is_new_tab_page function"""
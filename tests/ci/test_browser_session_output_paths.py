@@ -1,6 +1,7 @@
 """Test all recording and save functionality for Agent and BrowserSession."""
 
 import asyncio
+import gzip
 import json
 import shutil
 import zipfile
@@ -9,7 +10,9 @@ from pathlib import Path
 import pytest
 
 from browser_use import Agent, AgentHistoryList
+from browser_use.agent.views import ActionResult, AgentHistory, AgentOutput
 from browser_use.browser import BrowserProfile, BrowserSession
+from browser_use.browser.views import BrowserStateHistory
 from tests.ci.conftest import create_mock_llm
 
 
@@ -156,6 +159,29 @@ class TestAgentRecordings:
 		finally:
 			await browser_session.kill()
 
+	@pytest.mark.parametrize('filename', ['history.json', 'history.json.gz'])
+	def test_save_history_to_file(self, test_dir, filename):
+		"""Test saving and reloading agent history, gzip-compressed when the path ends in .gz."""
+		history = AgentHistoryList(
+			history=[
+				AgentHistory(
+					model_output=None,
+					result=[ActionResult(extracted_content='done', is_done=True, success=True)],
+					state=BrowserStateHistory(url='https://example.com', title='Example', tabs=[], interacted_element=[]),
+				)
+			]
+		)
+		history_path = test_dir / 'nested' / filename
+		history.save_to_file(history_path)
+
+		assert history_path.exists(), f'History file was not created at {history_path}'
+		if filename.endswith('.gz'):
+			assert json.loads(gzip.decompress(history_path.read_bytes()))['history'][0]['state']['url'] == 'https://example.com'
+
+		loaded = AgentHistoryList.load_from_file(history_path, AgentOutput)
+		assert loaded.final_result() == 'done'
+		assert loaded.urls() == ['https://example.com']
+
 	@pytest.mark.parametrize('generate_gif', [False, True, 'custom_path'])
 	async def test_generate_gif(self, test_dir, httpserver_url, llm, generate_gif):
 		"""Test GIF generation with different settings."""
@@ -13,6 +13,7 @@ import asyncio
 import json
 import logging
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -23,6 +24,7 @@ from browser_use.browser.profile import (
 	BrowserProfile,
 )
 from browser_use.browser.session import BrowserSession
+from browser_use.browser.views import BrowserError
 from browser_use.config import CONFIG
 
 # Set up test logging
@@ -151,6 +153,42 @@ class TestBrowserSessionStart:
 		assert result is browser_session
 		assert browser_session.initialized is True
 
+	async def test_start_circuit_breaker_fails_fast(self, browser_session):
+		"""Test that repeated start failures open the circuit breaker and later attempts fail fast until the cooldown elapses."""
+		setup_calls = 0
+
+		async def failing_setup_playwright():
+			nonlocal setup_calls
+			setup_calls += 1
+			raise RuntimeError('Simulated initialization failure')
+
+		browser_session.setup_playwright = failing_setup_playwright
+		breaker = browser_session._start_circuit_breaker
+
+		for _ in range(breaker.failure_threshold):
+			with pytest.raises(RuntimeError, match='Simulated initialization failure'):
+				await browser_session.start()
+		assert setup_calls == breaker.failure_threshold
+
+		# breaker is now open: start() raises immediately without attempting setup again
+		with pytest.raises(BrowserError, match='Not starting'):
+			await browser_session.start()
+		assert setup_calls == breaker.failure_threshold
+		assert browser_session.initialized is False
+
+		# once the cooldown has elapsed a single half-open attempt is let through again
+		breaker.recovery_seconds = 0
+		with pytest.raises(RuntimeError, match='Simulated initialization failure'):
+			await browser_session.start()
+		assert setup_calls == breaker.failure_threshold + 1
+
+		# only one probe is let through per cooldown window, concurrent callers keep failing fast
+		breaker.recovery_seconds = 30
+		breaker.opened_at = time.monotonic() - breaker.recovery_seconds
+		assert breaker.allow() is True
+		assert breaker.allow() is False
+		assert 29 < breaker.seconds_until_retry() <= 30
+
 	async def test_close_unstarted_session(self, browser_session):
 		"""Test calling .close() on a session that hasn't been started yet."""
 		# logger.info('Testing close on unstarted session')
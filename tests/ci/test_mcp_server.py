@@ -18,6 +18,7 @@ import json
 import pytest
 from pytest_httpserver import HTTPServer
 
+import browser_use.mcp.server as mcp_server
 from browser_use.mcp.server import BrowserUseServer
 
 
@@ -671,6 +672,20 @@ class TestMCPServerLifecycle:
 		result = await server._close_browser()
 		assert result == 'No browser session to close'
 
+	async def test_agent_task_bulkhead_fails_fast(self, monkeypatch):
+		"""Test that agent tasks beyond the concurrency limit fail fast instead of launching another browser."""
+		monkeypatch.setattr(mcp_server, 'AGENT_TASK_QUEUE_TIMEOUT', 0.1)
+		monkeypatch.setenv('BROWSER_USE_MCP_MAX_CONCURRENT_AGENTS', '3')
+		server = BrowserUseServer()
+		assert server._max_agent_tasks == 3
+
+		# occupy every slot as if that many agent tasks were already running
+		for _ in range(server._max_agent_tasks):
+			await server._agent_task_slots.acquire()
+
+		result = await server._retry_with_browser_use_agent(task='test task')
+		assert 'agent tasks are already running' in result
+
 
 class TestMCPServerWithLLM:
 	"""Test MCP server with LLM functionality."""
@@ -610,6 +610,39 @@ class TestCloudSync:
 		assert updated_events[2]['event_type'] == 'CreateAgentStepEvent'
 		assert updated_events[2]['step'] == 1
 
+	async def test_update_wal_events_keeps_partial_appends_and_cleans_up(self, temp_config_dir):
+		"""Test that a half-written trailing event survives the WAL rewrite and no temp file is left behind."""
+		auth = DeviceAuthClient(base_url='http://localhost:8000')
+		auth.auth_config.user_id = 'test-user-123'
+
+		service = CloudSync(base_url='http://localhost:8000', enable_auth=True)
+		service.auth_client = auth
+		service.session_id = 'test-session-id'
+
+		events_dir = temp_config_dir / 'events'
+		events_dir.mkdir(exist_ok=True)
+		wal_path = events_dir / f'{service.session_id}.jsonl'
+		tmp_wal_path = wal_path.with_suffix('.jsonl.tmp')
+
+		# last event is still being appended by the event bus when the rewrite runs
+		partial_event = '{"event_type": "CreateAgentStepEvent", "user_id": "99999999'
+		content = json.dumps({'event_type': 'CreateAgentTaskEvent', 'user_id': TEMP_USER_ID}) + '\n' + partial_event
+		await anyio.Path(wal_path).write_text(content)
+
+		await service._update_wal_user_ids(service.session_id)
+
+		lines = (await anyio.Path(wal_path).read_text()).split('\n')
+		assert json.loads(lines[0])['user_id'] == 'test-user-123'
+		assert lines[-1] == partial_event
+		assert not tmp_wal_path.exists()
+
+		# a corrupt event aborts the rewrite without touching the WAL or leaving the temp file around
+		corrupt_content = 'not json\n'
+		await anyio.Path(wal_path).write_text(corrupt_content)
+		await service._update_wal_user_ids(service.session_id)
+		assert await anyio.Path(wal_path).read_text() == corrupt_content
+		assert not tmp_wal_path.exists()
+
 
 class TestIntegration:
 	"""Integration tests for OAuth2 and cloud sync."""